@@ -181,7 +181,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown logic (if any)
     logger.info("Shutting down %s", settings.app_name)
-    # Add cleanup for services if needed (e.g., closing connections)
+    if freshdesk is not None:
+        await freshdesk.aclose()
+    await processor.aclose()
 
 def create_app() -> FastAPI:
     """
@@ -3,6 +3,7 @@
 from fastapi import (
     APIRouter, Depends, FastAPI, HTTPException, Request, BackgroundTasks, status, Response
 )
+import hmac
 import json
 import logging
 import time
@@ -166,17 +167,17 @@ async def validate_freshdesk_signature(request: Request, webhook_secret: Optiona
         # Get the raw request body
         body = await request.body()
         
-        # Calculate the expected signature
-        import hmac
-        import hashlib
-        calculated_signature = hmac.new(
-            webhook_secret.encode("utf-8"),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        # Compare signatures using constant-time comparison
-        is_valid = hmac.compare_digest(calculated_signature, received_signature)
+        try:
+            received_digest = bytes.fromhex(received_signature)
+        except ValueError:
+            logger.warning("X-Freshdesk-Signature header is not a hex digest")
+            return False
+
+        # Calculate the expected signature with the one-shot C HMAC
+        calculated_digest = hmac.digest(webhook_secret.encode("utf-8"), body, "sha256")
+
+        # Compare raw digests using constant-time comparison
+        is_valid = hmac.compare_digest(calculated_digest, received_digest)
         
         if not is_valid:
             logger.warning("Invalid webhook signature")
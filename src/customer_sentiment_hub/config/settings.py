@@ -70,6 +70,15 @@ class ProcessingSettings:
     batch_size: int = 5
     confidence_threshold: float = 0.3
     max_labels_per_review: int = 5
+    max_concurrent_batches: int = 8
+    requests_per_minute: int = 0    # 0 disables request pacing
+    tokens_per_minute: int = 0      # 0 disables token pacing
+    result_cache_size: int = 4096   # 0 disables caching of analyzed texts
+    min_review_chars: int = 1       # shorter reviews are not sent to the LLM; 0 sends all
+    fail_fast: bool = False         # stop at the first failed batch
+    adaptive_batch_size: bool = False
+    max_batch_size: int = 50
+    target_batch_latency: float = 10.0  # seconds per batch to tune towards
 
     @classmethod
     def from_environment(cls) -> "ProcessingSettings":
@@ -79,6 +88,23 @@ class ProcessingSettings:
                 "PROCESSING_CONFIDENCE_THRESHOLD", cls.confidence_threshold),
             max_labels_per_review=get_env_var_int(
                 "PROCESSING_MAX_LABELS", cls.max_labels_per_review),
+            max_concurrent_batches=get_env_var_int(
+                "PROCESSING_MAX_CONCURRENT_BATCHES", cls.max_concurrent_batches),
+            requests_per_minute=get_env_var_int(
+                "PROCESSING_REQUESTS_PER_MINUTE", cls.requests_per_minute),
+            tokens_per_minute=get_env_var_int(
+                "PROCESSING_TOKENS_PER_MINUTE", cls.tokens_per_minute),
+            result_cache_size=get_env_var_int(
+                "PROCESSING_RESULT_CACHE_SIZE", cls.result_cache_size),
+            min_review_chars=get_env_var_int(
+                "PROCESSING_MIN_REVIEW_CHARS", cls.min_review_chars),
+            fail_fast=get_env_var_bool("PROCESSING_FAIL_FAST", cls.fail_fast),
+            adaptive_batch_size=get_env_var_bool(
+                "PROCESSING_ADAPTIVE_BATCH_SIZE", cls.adaptive_batch_size),
+            max_batch_size=get_env_var_int(
+                "PROCESSING_MAX_BATCH_SIZE", cls.max_batch_size),
+            target_batch_latency=get_env_var_float(
+                "PROCESSING_TARGET_BATCH_LATENCY", cls.target_batch_latency),
         )
 
 # --- Added Freshdesk Settings --- 
@@ -88,15 +114,34 @@ class FreshdeskSettings:
     domain: Optional[str] = None
     webhook_secret: Optional[str] = None
     max_tag_len: int = 32
+    analysis_cache_size: int = 1024   # 0 disables the analysis cache
+    webhook_batch_size: int = 8       # 1 sends every webhook on its own
+    webhook_batch_window_ms: int = 200
+    ticket_cache_ttl: int = 60        # seconds; 0 disables the ticket cache
+    max_concurrent_requests: int = 20
+    max_retries: int = 3              # retries for throttled/failed requests
 
     # ---------- factory ----------
     @classmethod
     def from_environment(cls) -> "FreshdeskSettings":
+        # With slots=True, cls.<field> is a slot descriptor rather than the
+        # field's default, so the defaults are spelled out here
         return cls(
             api_key=get_env_var("FRESHDESK_API_KEY"),
             domain=get_env_var("FRESHDESK_DOMAIN"),
             webhook_secret=get_env_var("FRESHDESK_WEBHOOK_SECRET"),
-            max_tag_len=get_env_var_int("FRESHDESK_MAX_TAG_LEN", cls.max_tag_len),
+            max_tag_len=get_env_var_int("FRESHDESK_MAX_TAG_LEN", 32),
+            analysis_cache_size=get_env_var_int(
+                "FRESHDESK_ANALYSIS_CACHE_SIZE", 1024),
+            webhook_batch_size=get_env_var_int(
+                "FRESHDESK_WEBHOOK_BATCH_SIZE", 8),
+            webhook_batch_window_ms=get_env_var_int(
+                "FRESHDESK_WEBHOOK_BATCH_WINDOW_MS", 200),
+            ticket_cache_ttl=get_env_var_int(
+                "FRESHDESK_TICKET_CACHE_TTL", 60),
+            max_concurrent_requests=get_env_var_int(
+                "FRESHDESK_MAX_CONCURRENT_REQUESTS", 20),
+            max_retries=get_env_var_int("FRESHDESK_MAX_RETRIES", 3),
         )
 
     @property
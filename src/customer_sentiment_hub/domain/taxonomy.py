@@ -5,14 +5,15 @@ This module defines the hierarchical structure of categories, subcategories,
 and sentiment classifications used for analyzing customer reviews.
 """
 
+import sys
 from enum import Enum
-from typing import Dict, FrozenSet
+from typing import Dict, Final, FrozenSet, Tuple
 from functools import lru_cache
 
 # Define constants for clarity and maintainability
-POSITIVE = "Positive"
-NEGATIVE = "Negative"
-NEUTRAL = "Neutral"
+POSITIVE: Final = "Positive"
+NEGATIVE: Final = "Negative"
+NEUTRAL: Final = "Neutral"
 
 
 class Sentiment(str, Enum):
@@ -51,9 +52,12 @@ class CategoryType(str, Enum):
     MISCELLANEOUS = "Miscellaneous"
 
 
+# Plain sentiment strings, in declaration order, for inner loops
+_SENTIMENT_VALUES: Final[Tuple[str, ...]] = tuple(s.value for s in Sentiment)
+
 # Using immutable frozensets for better performance in lookups
-TAXONOMY = {
-    "Sentiments": frozenset(s.value for s in Sentiment),
+TAXONOMY: Final[Dict] = {
+    "Sentiments": frozenset(_SENTIMENT_VALUES),
     "Categories": {
         CategoryType.PRODUCT_SERVICES.value: {
             Sentiment.NEGATIVE.value: frozenset([
@@ -138,8 +142,18 @@ TAXONOMY = {
     }
 }
 
+# Intern every taxonomy string once so membership and equality checks
+# against these names can short-circuit on identity
+TAXONOMY["Categories"] = {
+    sys.intern(category): {
+        sys.intern(sentiment): frozenset(map(sys.intern, subcategories))
+        for sentiment, subcategories in sentiment_subcats.items()
+    }
+    for category, sentiment_subcats in TAXONOMY["Categories"].items()
+}
+
 # Build lookup dictionaries at module load time for faster access
-_SUBCATEGORY_TO_CATEGORY = {}
+_SUBCATEGORY_TO_CATEGORY: Final[Dict[str, str]] = {}
 for category, sentiment_subcats in TAXONOMY["Categories"].items():
     for sentiment, subcategories in sentiment_subcats.items():
         for subcategory in subcategories:
@@ -174,12 +188,68 @@ def get_valid_subcategories() -> Dict[str, FrozenSet[str]]:
     result = {}
     for category, sentiment_subcats in TAXONOMY["Categories"].items():
         combined = set()
-        for sentiment in Sentiment:
-            combined.update(sentiment_subcats[sentiment.value])
+        for sentiment in _SENTIMENT_VALUES:
+            combined.update(sentiment_subcats[sentiment])
         result[category] = frozenset(combined)
     return result
 
 
+@lru_cache(maxsize=1)
+def get_valid_pairs() -> FrozenSet[Tuple[str, str]]:
+    """
+    Get a frozenset of every valid (category, subcategory) pair.
+
+    Returns:
+        FrozenSet[Tuple[str, str]]: Immutable set of valid pairs
+
+    Performance:
+        O(1) - Uses cached result after first call
+    """
+    return frozenset(
+        (category, subcategory)
+        for category, subcategories in get_valid_subcategories().items()
+        for subcategory in subcategories
+    )
+
+
+# Default subcategories used when a label's subcategory is missing or invalid.
+# Resolved once from the taxonomy; min() keeps the choice stable across runs
+# (frozenset iteration order depends on string hash randomization).
+_DEFAULT_SUBCAT: Final[Dict[Tuple[str, str], str]] = {
+    (category, sentiment): min(subcategories)
+    for category, sentiment_subcats in TAXONOMY["Categories"].items()
+    for sentiment, subcategories in sentiment_subcats.items()
+    if subcategories
+}
+_DEFAULT_ANY_SUBCAT: Final[Dict[str, str]] = {
+    category: min(subcategories)
+    for category, subcategories in get_valid_subcategories().items()
+    if subcategories
+}
+
+
+def get_default_subcategory(category: str, sentiment: str) -> str:
+    """
+    Get the fallback subcategory for a category/sentiment pair.
+
+    Args:
+        category: The category name
+        sentiment: The sentiment value
+
+    Returns:
+        str: A valid subcategory for the pair, any subcategory of the
+             category if the pair has none, or "Other"
+
+    Performance:
+        O(1) - Uses precomputed lookup dictionaries
+    """
+    return (
+        _DEFAULT_SUBCAT.get((category, sentiment))
+        or _DEFAULT_ANY_SUBCAT.get(category)
+        or "Other"
+    )
+
+
 def get_category_for_subcategory(subcategory: str) -> str:
     """
     Get the parent category for a given subcategory.
@@ -208,10 +278,9 @@ def is_valid_subcategory_for_category(category: str, subcategory: str) -> bool:
         bool: True if the subcategory belongs to the category
         
     Performance:
-        O(1) - Uses frozenset lookups
+        O(1) - Single lookup in the cached pair set
     """
-    subcats = get_valid_subcategories().get(category)
-    return subcats is not None and subcategory in subcats
+    return (category, subcategory) in get_valid_pairs()
 
 
 @lru_cache(maxsize=1)
@@ -244,9 +313,9 @@ def generate_taxonomy_string() -> str:
     for category, sentiment_subcats in TAXONOMY["Categories"].items():
         taxonomy_parts.append(f"\n{category}:")
         
-        for sentiment in Sentiment:
-            taxonomy_parts.append(f"  {sentiment.value} sentiment subcategories:")
-            for subcat in sorted(sentiment_subcats[sentiment.value]):
+        for sentiment in _SENTIMENT_VALUES:
+            taxonomy_parts.append(f"  {sentiment} sentiment subcategories:")
+            for subcat in sorted(sentiment_subcats[sentiment]):
                 taxonomy_parts.append(f"  - {subcat}")
             taxonomy_parts.append("")
     
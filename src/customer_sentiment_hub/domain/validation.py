@@ -5,16 +5,187 @@ This module provides services for validating and correcting review labels
 to ensure they conform to the defined taxonomy structure.
 """
 
-from typing import Dict, List
+import string
+from typing import Dict, Final, FrozenSet, List, Mapping, Optional, Tuple
 from functools import lru_cache
+from types import MappingProxyType
 
 from customer_sentiment_hub.domain.taxonomy import (
-    Sentiment, CategoryType, TAXONOMY,
+    Sentiment, CategoryType,
     get_valid_categories, get_valid_subcategories,
-    get_category_for_subcategory, is_valid_subcategory_for_category
+    get_valid_pairs, get_category_for_subcategory, get_default_subcategory
 )
 
 
+# Standard sentiment values, shared by every ValidationService
+_VALID_SENTIMENTS: Final[FrozenSet[str]] = frozenset(s.value for s in Sentiment)
+
+# Drops punctuation around model output such as "Positive." or "'neg'"
+_STRIP_TABLE: Final[Dict[int, Optional[int]]] = str.maketrans("", "", string.punctuation)
+
+# Direct mapping for common sentiment variations - O(1) lookup
+_SENTIMENT_MAP: Final[Mapping[str, str]] = MappingProxyType({
+    "positive": Sentiment.POSITIVE.value,
+    "pos": Sentiment.POSITIVE.value,
+    "good": Sentiment.POSITIVE.value,
+    "favorable": Sentiment.POSITIVE.value,
+
+    "negative": Sentiment.NEGATIVE.value,
+    "neg": Sentiment.NEGATIVE.value,
+    "bad": Sentiment.NEGATIVE.value,
+    "unfavorable": Sentiment.NEGATIVE.value,
+
+    "neutral": Sentiment.NEUTRAL.value,
+    "neither": Sentiment.NEUTRAL.value,
+    "mixed": Sentiment.NEUTRAL.value,
+    "balanced": Sentiment.NEUTRAL.value,
+})
+
+# Known (category, subcategory) mistakes mapped to their corrected pair
+_PAIR_FIXUPS: Final[Mapping[Tuple[str, str], Tuple[str, str]]] = MappingProxyType({
+    (CategoryType.PRODUCT_SERVICES.value, "Fee Collection"):
+        (CategoryType.PRODUCT_SERVICES.value, "Progress Pace"),
+})
+
+# Category to use when the given one is invalid, keyed by subcategory alone
+_SUBCATEGORY_FIXUPS: Final[Mapping[str, str]] = MappingProxyType({
+    "Communication Method": CategoryType.COMMUNICATION.value,
+})
+
+
+def _fallback_sentiment(sentiment_lower: str) -> str:
+    """
+    Resolve a lowercased sentiment that has no exact alias.
+
+    Args:
+        sentiment_lower: The lowercased raw sentiment value
+
+    Returns:
+        str: Standardized sentiment value, Neutral if nothing matches
+    """
+    if "positive" in sentiment_lower:
+        return Sentiment.POSITIVE.value
+    elif "negative" in sentiment_lower:
+        return Sentiment.NEGATIVE.value
+    elif "neutral" in sentiment_lower:
+        return Sentiment.NEUTRAL.value
+    
+    # Default case
+    return Sentiment.NEUTRAL.value
+
+
+@lru_cache(maxsize=256)
+def _clean_sentiment(sentiment: Optional[str]) -> str:
+    """
+    Clean and standardize a sentiment value.
+
+    Module-level so the cache is shared by every ValidationService and does
+    not hold references to service instances.
+    """
+    if not sentiment:
+        return Sentiment.NEUTRAL.value
+        
+    # Normalize punctuation and casing for more reliable matching
+    sentiment_lower = sentiment.translate(_STRIP_TABLE).strip().lower()
+    
+    # Try exact match in normalized map, then substring matching
+    return _SENTIMENT_MAP.get(sentiment_lower) or _fallback_sentiment(sentiment_lower)
+
+
+@lru_cache(maxsize=4096)
+def _fix_triple(
+    category: Optional[str],
+    subcategory: Optional[str],
+    sentiment: Optional[str],
+    unlabeled: bool = False,
+) -> Tuple[str, str, str]:
+    """
+    Correct a (category, subcategory, sentiment) triple against the taxonomy.
+
+    Labels from the model repeat the same few triples, so results are cached
+    by the raw field values. unlabeled marks a label that has neither a
+    category nor a subcategory field, as opposed to fields set to None.
+    """
+    valid_categories = get_valid_categories()
+    valid_subcategories = get_valid_subcategories()
+    valid_pairs = get_valid_pairs()
+
+    # 1) Clean or default the sentiment
+    if sentiment is None or sentiment not in _VALID_SENTIMENTS:
+        sentiment = _clean_sentiment(sentiment) if sentiment else Sentiment.NEUTRAL.value
+
+    # 2) Handle entirely empty labels
+    if unlabeled:
+        return CategoryType.MISCELLANEOUS.value, "Other", sentiment
+
+    # 3) Correct swapped category/subcategory fields
+    #    e.g. category="Progress Pace", subcategory="Product & Services"
+    if (
+        subcategory is not None
+        and category in valid_subcategories.get(subcategory, ())
+        and subcategory in valid_categories
+    ):
+        category, subcategory = subcategory, category
+
+    # 4) Apply known pair corrections, e.g. Fee Collection under
+    #    Product & Services → Progress Pace
+    if category is not None and subcategory is not None:
+        correction = _PAIR_FIXUPS.get((category, subcategory))
+        if correction:
+            category, subcategory = correction
+
+    #    Invalid category with a known subcategory, e.g.
+    #    Communication Method → Communication
+    if category not in valid_categories and subcategory is not None:
+        category = _SUBCATEGORY_FIXUPS.get(subcategory, category)
+
+    # 5) Fill in or correct the category
+    if category is None or category not in valid_categories:
+        # If subcategory is valid, infer its parent category
+        parent = get_category_for_subcategory(subcategory) if subcategory else None
+        if parent is None or parent not in valid_categories:
+            parent = CategoryType.MISCELLANEOUS.value
+        category = parent
+
+    # 6) Fill in or correct the subcategory
+    #   a) Missing subcategory, or
+    #   b) Subcategory not valid for this category
+    if not subcategory or (category, subcategory) not in valid_pairs:
+        # pick the default subcategory for that (category, sentiment)
+        subcategory = get_default_subcategory(category, sentiment)
+
+    return category, subcategory, sentiment
+
+
+def _validate_and_fix_label_fast(label: Dict[str, str]) -> Dict[str, str]:
+    """
+    Validate and fix a single label.
+
+    The corrected fields come from the cached _fix_triple, and the output
+    dict is only built when something changed.
+    """
+    category, subcategory, sentiment = _fix_triple(
+        label.get("category"),
+        label.get("subcategory"),
+        label.get("sentiment"),
+        "category" not in label and "subcategory" not in label,
+    )
+
+    # Return the caller's label untouched when nothing needed fixing
+    if (
+        category == label.get("category")
+        and subcategory == label.get("subcategory")
+        and sentiment == label.get("sentiment")
+    ):
+        return label
+    return {
+        **label,
+        "category": category,
+        "subcategory": subcategory,
+        "sentiment": sentiment,
+    }
+
+
 class ValidationService:
     """
     Service for validating and fixing review labels.
@@ -23,14 +194,14 @@ class ValidationService:
     applying corrections when possible rather than rejecting invalid data.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the validation service with taxonomy references."""
         # Cache these values to avoid repeated lookups
-        self.valid_categories = get_valid_categories()
-        self.valid_subcategories = get_valid_subcategories()
-        self.valid_sentiments = frozenset(s.value for s in Sentiment)
+        self.valid_categories: FrozenSet[str] = get_valid_categories()
+        self.valid_subcategories: Dict[str, FrozenSet[str]] = get_valid_subcategories()
+        self.valid_sentiments: FrozenSet[str] = _VALID_SENTIMENTS
+        self.valid_pairs: FrozenSet[Tuple[str, str]] = get_valid_pairs()
     
-    @lru_cache(maxsize=100)
     def clean_sentiment(self, sentiment: str) -> str:
         """
         Clean and standardize sentiment values.
@@ -44,131 +215,16 @@ class ValidationService:
         Performance:
             O(1) - Uses cached results for repeated inputs
         """
-        if not sentiment:
-            return Sentiment.NEUTRAL.value
-            
-        # Normalize casing for more reliable matching
-        sentiment_lower = sentiment.lower()
-        
-        # Direct mapping for common variations - O(1) lookup
-        sentiment_map = {
-            "positive": Sentiment.POSITIVE.value,
-            "pos": Sentiment.POSITIVE.value,
-            "good": Sentiment.POSITIVE.value,
-            "favorable": Sentiment.POSITIVE.value,
-            
-            "negative": Sentiment.NEGATIVE.value,
-            "neg": Sentiment.NEGATIVE.value,
-            "bad": Sentiment.NEGATIVE.value,
-            "unfavorable": Sentiment.NEGATIVE.value,
-            
-            "neutral": Sentiment.NEUTRAL.value,
-            "neither": Sentiment.NEUTRAL.value,
-            "mixed": Sentiment.NEUTRAL.value,
-            "balanced": Sentiment.NEUTRAL.value,
-        }
-        
-        # Try exact match in normalized map
-        if sentiment_lower in sentiment_map:
-            return sentiment_map[sentiment_lower]
-        
-        # Use substring matching as fallback
-        if "positive" in sentiment_lower:
-            return Sentiment.POSITIVE.value
-        elif "negative" in sentiment_lower:
-            return Sentiment.NEGATIVE.value
-        elif "neutral" in sentiment_lower:
-            return Sentiment.NEUTRAL.value
-        
-        # Default case
-        return Sentiment.NEUTRAL.value
+        return _clean_sentiment(sentiment)
     
     def validate_and_fix_label(self, label: Dict[str, str]) -> Dict[str, str]:
         """
         Validate and fix a label so it always conforms to the taxonomy.
+
+        The input label is never mutated. It is copied lazily on the first
+        correction, so an already valid label is returned as-is.
         """
-        fixed = label.copy()
-
-        # 1) Clean or default the sentiment
-        fixed["sentiment"] = (
-            self.clean_sentiment(fixed.get("sentiment"))
-            if "sentiment" in fixed
-            else Sentiment.NEUTRAL.value
-        )
-
-        # 2) Handle entirely empty labels
-        if "category" not in fixed and "subcategory" not in fixed:
-            return {
-                "category": CategoryType.MISCELLANEOUS.value,
-                "subcategory": "Other",
-                "sentiment": fixed["sentiment"],
-            }
-
-        # 3) Correct swapped category/subcategory fields
-        #    e.g. category="Progress Pace", subcategory="Product & Services"
-        if (
-            fixed.get("category") in self.valid_subcategories.get(fixed.get("subcategory", ""), set())
-            and fixed.get("subcategory") in self.valid_categories
-        ):
-            fixed["category"], fixed["subcategory"] = (
-                fixed["subcategory"],
-                fixed["category"],
-            )
-
-        #   a) Fee Collection under Product & Services → use Progress Pace
-        if (
-            fixed.get("category") == CategoryType.PRODUCT_SERVICES.value
-            and fixed.get("subcategory") == "Fee Collection"
-        ):
-            fixed["subcategory"] = "Progress Pace"
-
-        #   b) Invalid Category + Communication Method → category = Communication
-        if (
-            fixed.get("category") not in self.valid_categories
-            and fixed.get("subcategory") == "Communication Method"
-        ):
-            fixed["category"] = "Communication"
-
-        # 5) Fill in or correct the category
-        if fixed.get("category") not in self.valid_categories:
-            # If subcategory is valid, infer its parent category
-            subcat = fixed.get("subcategory")
-            parent = get_category_for_subcategory(subcat) if subcat else None
-            if parent in self.valid_categories:
-                fixed["category"] = parent
-            else:
-                fixed["category"] = CategoryType.MISCELLANEOUS.value
-
-        # 6) Fill in or correct the subcategory
-        subcats_for_cat = self.valid_subcategories.get(fixed["category"], set())
-
-        #   a) Missing subcategory
-        if "subcategory" not in fixed or not fixed["subcategory"]:
-            # pick any valid subcategory for that (category, sentiment)
-            choices = TAXONOMY["Categories"][fixed["category"]].get(
-                fixed["sentiment"], set()
-            )
-            if choices:
-                fixed["subcategory"] = next(iter(choices))
-            elif subcats_for_cat:
-                fixed["subcategory"] = next(iter(subcats_for_cat))
-            else:
-                fixed["subcategory"] = "Other"
-
-        #   b) Subcategory not valid for this category
-        elif not is_valid_subcategory_for_category(fixed["category"], fixed["subcategory"]):
-            # again pick a valid one
-            choices = TAXONOMY["Categories"][fixed["category"]].get(
-                fixed["sentiment"], set()
-            )
-            if choices:
-                fixed["subcategory"] = next(iter(choices))
-            elif subcats_for_cat:
-                fixed["subcategory"] = next(iter(subcats_for_cat))
-            else:
-                fixed["subcategory"] = "Other"
-
-        return fixed
+        return _validate_and_fix_label_fast(label)
 
     
     def validate_review_labels(self, labels: List[Dict[str, str]]) -> List[Dict[str, str]]:
@@ -184,4 +240,5 @@ class ValidationService:
         if not labels:
             return []
         
-        return [self.validate_and_fix_label(label) for label in labels]
\ No newline at end of file
+        fix = _validate_and_fix_label_fast
+        return [fix(label) for label in labels]
\ No newline at end of file
@@ -17,6 +17,7 @@ from customer_sentiment_hub.prompts.formatters import (
 from customer_sentiment_hub.prompts.templates import (
     create_review_analysis_prompt,
     get_populated_prompt,
+    get_prompt_parts,
 
 )
 
@@ -29,5 +30,6 @@ __all__ = [
     # Template management
     'create_review_analysis_prompt',
     'get_populated_prompt',
+    'get_prompt_parts',
 
 ]
\ No newline at end of file
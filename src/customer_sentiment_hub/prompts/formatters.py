@@ -6,6 +6,9 @@ from langchain.output_parsers import PydanticOutputParser
 
 from customer_sentiment_hub.domain.schema import ReviewOutput
 
+# Prebuilt "Review N: " prefixes covering typical batch sizes
+_PREFIXES = tuple(f"Review {i + 1}: " for i in range(256))
+
 
 def format_reviews_for_prompt(review_texts: List[str]) -> str:
     """
@@ -17,8 +20,12 @@ def format_reviews_for_prompt(review_texts: List[str]) -> str:
     Returns:
         str: Formatted reviews text
     """
-    reviews_input = [f"Review {i+1}: {text}" for i, text in enumerate(review_texts)]
-    return "\n\n".join(reviews_input)
+    prefixes = _PREFIXES
+    limit = len(prefixes)
+    return "\n\n".join(
+        prefixes[i] + text if i < limit else f"Review {i + 1}: {text}"
+        for i, text in enumerate(review_texts)
+    )
 
 
 def get_format_instructions() -> str:
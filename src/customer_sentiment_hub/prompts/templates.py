@@ -1,19 +1,15 @@
 """Prompt templates for LLM services."""
 
+from functools import lru_cache
+from typing import Tuple
+
 from langchain.prompts import ChatPromptTemplate
 
 from customer_sentiment_hub.domain.taxonomy import generate_taxonomy_string
 from customer_sentiment_hub.prompts.formatters import get_format_instructions
 
 
-def create_review_analysis_prompt() -> ChatPromptTemplate:
-    """
-    Create a prompt template for review analysis.
-    
-    Returns:
-        ChatPromptTemplate: The prompt template
-    """
-    template = """You are an expert in customer feedback analysis for debt settlement services.
+_REVIEW_ANALYSIS_TEMPLATE = """You are an expert in customer feedback analysis for debt settlement services.
             
 Your task is to analyze customer reviews and classify them according to the following taxonomy:
 
@@ -54,8 +50,63 @@ Reviews to classify:
 
 {format_instructions}
 """
+
+
+def create_review_analysis_prompt() -> ChatPromptTemplate:
+    """
+    Create a prompt template for review analysis.
     
-    return ChatPromptTemplate.from_template(template)
+    Returns:
+        ChatPromptTemplate: The prompt template
+    """
+    return ChatPromptTemplate.from_template(_REVIEW_ANALYSIS_TEMPLATE)
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces so the prompt formatter leaves them alone."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+@lru_cache(maxsize=1)
+def _cached_partial_prompt() -> ChatPromptTemplate:
+    """
+    Build the review analysis prompt with its constant parts filled in.
+
+    The taxonomy and format instructions never change while the process
+    runs, so they are substituted into the template string once. The
+    resulting prompt has ``reviews`` as its only variable, and its static
+    prefix is byte-identical across requests.
+
+    Returns:
+        ChatPromptTemplate: The prompt with taxonomy and format instructions set
+    """
+    prefilled = (
+        _REVIEW_ANALYSIS_TEMPLATE
+        .replace("{taxonomy}", _escape_braces(generate_taxonomy_string()))
+        .replace("{format_instructions}", _escape_braces(get_format_instructions()))
+    )
+    return ChatPromptTemplate.from_template(prefilled)
+
+
+# Placeholder used to locate the reviews slot in the formatted prompt
+_REVIEWS_MARKER = "\x00REVIEWS\x00"
+
+
+@lru_cache(maxsize=1)
+def get_prompt_parts() -> Tuple[str, str]:
+    """
+    Split the fully formatted prompt around its reviews slot.
+
+    ``prefix + reviews_text + suffix`` equals
+    ``get_populated_prompt(reviews_text).format(reviews=reviews_text)``,
+    so callers can build the prompt with one string concatenation.
+
+    Returns:
+        Tuple[str, str]: The text before and after the reviews
+    """
+    formatted = _cached_partial_prompt().format(reviews=_REVIEWS_MARKER)
+    prefix, suffix = formatted.split(_REVIEWS_MARKER)
+    return prefix, suffix
 
 
 def get_populated_prompt(reviews: str) -> ChatPromptTemplate:
@@ -64,19 +115,9 @@ def get_populated_prompt(reviews: str) -> ChatPromptTemplate:
     
     Args:
         reviews: Review texts formatted for inclusion in the prompt
+            (filled in later by the chain, so not used here)
         
     Returns:
         ChatPromptTemplate: The populated prompt template
     """
-    template = create_review_analysis_prompt()
-    
-    # Get the taxonomy string
-    taxonomy_string = generate_taxonomy_string()
-    
-    # Get format instructions
-    format_instructions = get_format_instructions()
-    
-    return template.partial(
-        taxonomy=taxonomy_string,
-        format_instructions=format_instructions,
-    )
\ No newline at end of file
+    return _cached_partial_prompt()
@@ -2,18 +2,36 @@
 
 """Service for integrating with Freshdesk."""
 
+import asyncio
+import copy
+import hashlib
+import hmac
 import logging
-import json
 import os
-from typing import Dict, List, Any, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from html import unescape
+from typing import Dict, List, Any, Optional, Tuple
 import aiohttp
 from pydantic import BaseModel
 from pathlib import Path
+from types import MappingProxyType
 
 # Imports for HTML parsing and templating
-from bs4 import BeautifulSoup
-from jinja2 import Environment, FileSystemLoader, select_autoescape, TemplateNotFound
-
+from lxml import etree, html as lxml_html
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateNotFound,
+    select_autoescape,
+)
+from markupsafe import Markup, escape
+
+from customer_sentiment_hub.utils.helpers import json_dumps, json_loads
 from customer_sentiment_hub.utils.result import Result, Success, Error
 from customer_sentiment_hub.services.processor import ReviewProcessor
 from customer_sentiment_hub.api.models import FreshdeskWebhookPayload 
@@ -21,23 +39,342 @@ from customer_sentiment_hub.config.settings import (settings, FreshdeskSettings)
 
 logger = logging.getLogger(__name__)
 
+
+def _tojson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize for Jinja's tojson filter, which passes json.dumps options."""
+    indent = bool(kwargs.get("indent"))
+    return json_dumps(obj, indent=indent, sort_keys=bool(kwargs.get("sort_keys"))).decode("utf-8")
+
+
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+
+
+def _template_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Return a bytecode cache in the user's temp directory, or None.
+
+    Compiled templates survive worker restarts this way. The cache is
+    optional: if the directory can't be created, templates compile from
+    source as before.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except OSError as e:
+        logger.warning(f"Jinja2 bytecode cache disabled: {e}")
+        return None
+
+
+# Closes the document opened by the header template
+NOTE_FOOTER_HTML = "</body>\n</html>"
 try:
     jinja_env = Environment(
         loader=FileSystemLoader(TEMPLATE_DIR),
-        autoescape=select_autoescape(["html", "xml"])
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=_template_bytecode_cache(),
     )
-    # Load the template with inline styles
-    freshdesk_note_template = jinja_env.get_template("freshdesk_note_template_inline_styles.html")
+    # The note's raw-analysis block goes through tojson on every render
+    jinja_env.policies["json.dumps_function"] = _tojson_dumps
+    # The header (document head, styles, title) has no variables, so it is
+    # rendered once here; only the body template is rendered per note
+    NOTE_HEADER_HTML = jinja_env.get_template("freshdesk_note_header.html").render()
+    freshdesk_note_template = jinja_env.get_template("freshdesk_note_body.html")
     logger.info(f"Successfully loaded Freshdesk note template from {TEMPLATE_DIR}")
 except TemplateNotFound:
+    NOTE_HEADER_HTML = ""
     freshdesk_note_template = None
     logger.warning(f"Freshdesk note template not found in {TEMPLATE_DIR}. Notes will use basic formatting.")
 except Exception as e:
+    NOTE_HEADER_HTML = ""
     freshdesk_note_template = None
     logger.error(f"Error initializing Jinja2 environment: {e}", exc_info=True)
     logger.warning("Notes will use basic formatting due to Jinja2 error.")
 
+# Inline sentiment styles for the fallback note formatting
+_FALLBACK_SENTIMENT_STYLES = MappingProxyType({
+    "positive": "color: #2E7D32; font-weight: bold;",
+    "negative": "color: #C62828; font-weight: bold;",
+})
+_FALLBACK_DEFAULT_STYLE = "color: #546E7A; font-weight: bold;"
+_FALLBACK_TABLE_OPEN = (
+    "<table border=\"1\" style=\"border-collapse: collapse; width: 100%; margin-top: 10px;\">"
+    "<tr><th>Category</th><th>Subcategory</th><th>Sentiment</th></tr>"
+)
+
+
+def _fallback_label_row(category: str, subcategory: str, sentiment: str) -> str:
+    """Render one label as a table row for the fallback note formatting."""
+    style = _FALLBACK_SENTIMENT_STYLES.get(sentiment.lower(), _FALLBACK_DEFAULT_STYLE)
+    return (
+        f"<tr><td>{escape(category)}</td><td>{escape(subcategory)}</td>"
+        f"<td style=\"{style}\">{escape(sentiment)}</td></tr>"
+    )
+
+
+def _scan_labels(
+    labels: List[Dict], max_tag_len: int
+) -> Tuple[List[str], Markup, Dict[str, int]]:
+    """
+    Walk the analysis labels once for everything the ticket update needs.
+
+    Returns:
+        Tuple of the de-duplicated tags (in label order), the escaped
+        ``<tr>`` rows for the note table and the per-sentiment counts.
+    """
+    # dict keys keep the first occurrence of each tag in label order, so the
+    # same analysis always produces the same PUT body
+    tags: Dict[str, None] = {}
+    rows: List[str] = []
+    counts = {"Positive": 0, "Negative": 0, "Neutral": 0}
+    for label in labels:
+        category = label.get("category", "")
+        subcategory = label.get("subcategory", "")
+        sentiment = label.get("sentiment", "")
+        if category:
+            tags[_slugify_tag("cat_" + category, max_tag_len)] = None
+        if subcategory:
+            tags[_slugify_tag("sub_" + subcategory, max_tag_len)] = None
+        if sentiment:
+            tags[_slugify_tag("sent_" + sentiment, max_tag_len)] = None
+        if sentiment in counts:
+            counts[sentiment] += 1
+        css = escape(sentiment.lower())
+        rows.append(
+            f'<tr class="row-{css}"><td>{escape(category)}</td>'
+            f'<td>{escape(subcategory)}</td>'
+            f'<td><span class="sentiment sentiment-{css}">{escape(sentiment)}</span></td></tr>'
+        )
+    return list(tags), Markup("".join(rows)), counts
+
+
+# Elements whose text content is never part of the review
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+# Descriptions shorter than this are cheap to clean: they may take the regex
+# fast path in _extract_review_text and are never moved off the event loop
+_SMALL_DESCRIPTION_LEN = 2048
+
+# Regexes for the small-description fast path in _extract_clean_review_text
+# Only well-formed tags and end tags; a "<" or ">" left over after removing
+# them (e.g. "I <3 it", "fees > 10%", a comment) sends the text to the parser
+_TAG_RE = re.compile(r"</?[A-Za-z][^<>]*>")
+_SKIPPED_TAG_RE = re.compile(
+    r"<(?:" + "|".join(sorted(_SKIPPED_TAGS)) + r")\b", re.IGNORECASE
+)
+
+
+def _join_fragments(fragments: List[str]) -> str:
+    """Join stripped, non-empty text fragments with single spaces."""
+    return " ".join(
+        fragment for fragment in (text.strip() for text in fragments) if fragment
+    )
+
+
+class _ReviewExtractor:
+    """
+    lxml parser target that collects the review text in a single pass.
+
+    Only the text inside the first ``div#ticket_original_request`` (and the
+    first ``span.quoted-text`` within it) is kept, so no tree is built.
+    ``close()`` returns ``(quoted_text, request_text)``.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all state so the target can be fed another document."""
+        self._buffer: List[str] = []
+        self._skip_depth = 0
+        self._request_depth = 0
+        self._quote_depth = 0
+        self._request_seen = False
+        self._quote_seen = False
+        self._request: List[str] = []
+        self._quoted: List[str] = []
+
+    def _flush(self) -> None:
+        # One flushed buffer is one text node, matching itertext() fragments
+        if self._buffer:
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            if self._request_depth:
+                self._request.append(text)
+                if self._quote_depth:
+                    self._quoted.append(text)
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        self._flush()
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        if self._request_depth:
+            self._request_depth += 1
+            if self._quote_depth:
+                self._quote_depth += 1
+            elif (
+                not self._quote_seen
+                and tag == "span"
+                and "quoted-text" in attrib.get("class", "").split()
+            ):
+                self._quote_depth = 1
+                self._quote_seen = True
+        elif (
+            not self._request_seen
+            and tag == "div"
+            and attrib.get("id") == "ticket_original_request"
+        ):
+            self._request_depth = 1
+            self._request_seen = True
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        if self._request_depth:
+            self._request_depth -= 1
+            if self._quote_depth:
+                self._quote_depth -= 1
+
+    def data(self, text: str) -> None:
+        if self._request_depth and not self._skip_depth:
+            self._buffer.append(text)
+
+    def comment(self, text: str) -> None:
+        self._flush()
+
+    def close(self) -> Tuple[str, str]:
+        self._flush()
+        return _join_fragments(self._quoted), _join_fragments(self._request)
+
+
+# lxml parsers must not be shared between threads, and large descriptions
+# are parsed in worker threads, so each thread keeps its own parser
+_parser_local = threading.local()
+
+
+def _review_parser() -> Tuple[etree.HTMLParser, _ReviewExtractor]:
+    """Return this thread's reusable review parser and its (reset) target."""
+    cached = getattr(_parser_local, "review_parser", None)
+    if cached is None:
+        extractor = _ReviewExtractor()
+        cached = (etree.HTMLParser(target=extractor), extractor)
+        _parser_local.review_parser = cached
+    else:
+        # A failed parse may have left partial state behind
+        cached[1].reset()
+    return cached
+
+
+def _node_text(node: Any) -> str:
+    """Join the stripped text fragments under an lxml node with single spaces."""
+    return _join_fragments(node.itertext())
+
+
+def _extract_review_text(html_content: str) -> str:
+    """Return the customer's review text from a Freshdesk ticket description."""
+    if not html_content:
+        return ""
+    if "<" not in html_content:
+        # Automations sometimes send the description as plain text. Without
+        # a "<" there is no markup to parse, so only decode entities; the
+        # result is what the parser would have produced for the same input.
+        return unescape(html_content).strip()
+    if (
+        len(html_content) < _SMALL_DESCRIPTION_LEN
+        and "ticket_original_request" not in html_content
+        and not _SKIPPED_TAG_RE.search(html_content)
+    ):
+        # Short replies without Freshdesk's structured markup: split on the
+        # tags with a regex instead of running the HTML parser, unless some
+        # "<" or ">" is not part of a plain tag. The pieces between tags are
+        # the parser's text nodes, so joining them gives the same result.
+        fragments = _TAG_RE.split(html_content)
+        if not any("<" in fragment or ">" in fragment for fragment in fragments):
+            return _join_fragments([unescape(fragment) for fragment in fragments])
+    try:
+        return _parse_review_text(html_content)
+    except Exception as e:
+        logger.error(f"Error parsing HTML to extract review text: {e}", exc_info=True)
+        return html_content
+
+
+def _parse_review_text(html_content: str) -> str:
+    """Extract the review text with the HTML parser; see _extract_review_text."""
+    # Stream the document once, keeping only the original request text
+    parser, _ = _review_parser()
+    extracted: Tuple[str, str] = etree.fromstring(html_content, parser)
+    quoted_text, request_text = extracted
+    if quoted_text:
+        logger.info("Extracted review text from span.quoted-text")
+        return quoted_text
+    if request_text and len(request_text) < 10000:
+        logger.info("Extracted review text from div#ticket_original_request (fallback 1)")
+        return request_text
+
+    # No usable original request: take all text from the full document
+    try:
+        tree = lxml_html.fromstring(html_content)
+    except etree.ParserError:
+        # Markup with no elements at all (e.g. only a comment)
+        return ""
+    if not isinstance(tree.tag, str):
+        # lxml returns the comment itself when it is the only node besides
+        # whitespace, e.g. "&nbsp;<!-- note -->"
+        return ""
+    # Drop non-content elements in one C-level pass over the tree
+    etree.strip_elements(tree, *_SKIPPED_TAGS, with_tail=False)
+    clean_text = _node_text(tree)
+    logger.info("Extracted review text from raw HTML (fallback 2)")
+    return clean_text
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """
+    Seconds to wait before retrying a throttled or failed Freshdesk request.
+
+    Honours a numeric ``Retry-After`` header; otherwise backs off
+    exponentially (1s, 2s, 4s, ...). Never waits longer than 60 seconds.
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), 60.0)
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    return min(2.0 ** attempt, 60.0)
+
+
+# Result for webhook analyses still queued when the service shuts down
+_SHUTDOWN_ERROR = "Freshdesk service is shutting down"
+
+
+def _fail_batch(batch: List[Tuple], message: str) -> None:
+    """Resolve the futures of queued webhook analyses with an Error."""
+    for *_, future in batch:
+        if not future.done():
+            future.set_result(Error(message))
+
+
+# Default headers for the shared Freshdesk session
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# Upper bound on tickets kept by FreshdeskService's short-lived ticket cache
+_TICKET_CACHE_MAX = 512
+
+
+# Spaces and ampersands rewritten in a single str.translate pass
+_TAG_TABLE = str.maketrans({" ": "_", "&": "and"})
+
+
+@lru_cache(maxsize=512)
+def _slugify_tag(raw: str, max_len: int) -> str:
+    """Turn a prefixed taxonomy value into a Freshdesk tag of at most max_len chars."""
+    cleaned = raw.translate(_TAG_TABLE).lower()
+    if len(cleaned) > max_len:
+        logger.debug("Trimming tag '%s' → '%s'", cleaned, cleaned[:max_len])
+    return cleaned[:max_len]
+
+
 class FreshdeskService:
     """Service for interacting with the Freshdesk REST API."""
 
@@ -49,6 +386,22 @@ class FreshdeskService:
             Injected config (useful for tests). Defaults to global `settings.freshdesk`.
         """
         self.cfg: FreshdeskSettings = cfg or settings.freshdesk
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Caps in-flight Freshdesk requests so webhook bursts queue here
+        # instead of tripping the account's rate limit
+        self._request_slots = asyncio.Semaphore(self.cfg.max_concurrent_requests)
+        # Analyses keyed by sha256 of the cleaned review text, oldest first
+        self._analysis_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        # Recently fetched tickets: ticket_id -> (expiry, ticket), oldest first
+        self._ticket_cache: "OrderedDict[int, Tuple[float, Dict]]" = OrderedDict()
+        # Webhook analyses waiting to be sent to the processor together;
+        # the worker task is started on first use inside the running loop
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_worker: Optional[asyncio.Task] = None
+        # Encoded once; signature checks run on every webhook
+        self._secret_bytes: Optional[bytes] = (
+            self.cfg.webhook_secret.encode("utf-8") if self.cfg.webhook_secret else None
+        )
 
         if not self.cfg.is_configured:
             self._active = False
@@ -73,73 +426,240 @@ class FreshdeskService:
         )
 
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # All traffic goes to one Freshdesk host, so the per-host limit is
+            # the one that matters; keep DNS and idle connections around.
+            self._session = aiohttp.ClientSession(
+                auth=self.auth,
+                # Every Freshdesk call sends JSON; set the header once here
+                # instead of building a dict per request
+                headers=_JSON_HEADERS,
+                connector=aiohttp.TCPConnector(
+                    limit=50,
+                    limit_per_host=20,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> Tuple[int, bytes]:
+        """
+        Send one Freshdesk request and return its status and raw body.
+
+        429 responses, and 5xx responses to idempotent methods, are retried up
+        to ``max_retries`` times, waiting for Retry-After when Freshdesk sends
+        it and backing off exponentially otherwise. A POST that failed with a
+        5xx may already have been applied, so it is not repeated. The
+        concurrency slot is released while waiting.
+        """
+        session = await self._get_session()
+        retry_server_errors = method != "POST"
+        attempt = 0
+        while True:
+            async with self._request_slots:
+                async with session.request(method, url, **kwargs) as response:
+                    status = response.status
+                    body = await response.read()
+                    retry_after = response.headers.get("Retry-After")
+            retryable = status == 429 or (status >= 500 and retry_server_errors)
+            if not retryable or attempt >= self.cfg.max_retries:
+                return status, body
+            delay = _retry_delay(retry_after, attempt)
+            attempt += 1
+            logger.warning(
+                "Freshdesk %s %s returned %s; retry %d/%d in %.1fs",
+                method, url, status, attempt, self.cfg.max_retries, delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        """
+        Stop the batch worker and close the shared HTTP session.
+
+        Webhooks still waiting for a batch get an Error result instead of
+        waiting forever.
+        """
+        if self._batch_worker is not None:
+            self._batch_worker.cancel()
+            try:
+                await self._batch_worker
+            except asyncio.CancelledError:
+                pass
+            self._batch_worker = None
+        if self._batch_queue is not None:
+            while not self._batch_queue.empty():
+                _fail_batch([self._batch_queue.get_nowait()], _SHUTDOWN_ERROR)
+            self._batch_queue = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _analyze(
+        self, processor: ReviewProcessor, review_text: str, review_id: str
+    ) -> Result[Dict]:
+        """
+        Analyze one review, sharing a processor call with concurrent webhooks.
+
+        Reviews arriving within the batch window are sent to the processor
+        together so the large static prompt is paid for once per batch.
+        """
+        if self.cfg.webhook_batch_size <= 1:
+            return await processor.process_reviews([review_text], [review_id])
+
+        if (
+            self._batch_queue is None
+            or self._batch_worker is None
+            or self._batch_worker.done()
+        ):
+            # (Re)start the worker, e.g. after the loop it ran on was closed
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = asyncio.create_task(self._run_batches(self._batch_queue))
+        future: "asyncio.Future[Result[Dict]]" = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((processor, review_text, review_id, future))
+        return await future
+
+    async def _run_batches(self, queue: asyncio.Queue) -> None:
+        """
+        Collect queued reviews into batches and dispatch them until cancelled.
+
+        On cancellation the batch being collected or dispatched gets an
+        Error result; reviews still in the queue are left to aclose().
+        """
+        loop = asyncio.get_running_loop()
+        max_size = self.cfg.webhook_batch_size
+        window = self.cfg.webhook_batch_window_ms / 1000
+        batch: List[Tuple] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + window
+                while len(batch) < max_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                await self._dispatch_batch(batch)
+                batch = []
+        except asyncio.CancelledError:
+            _fail_batch(batch, _SHUTDOWN_ERROR)
+            raise
+
+    async def _dispatch_batch(self, batch: List[Tuple]) -> None:
+        """Run one processor call per processor in the batch and resolve the futures."""
+        by_processor: Dict[int, List[Tuple]] = {}
+        for item in batch:
+            by_processor.setdefault(id(item[0]), []).append(item)
+
+        for items in by_processor.values():
+            processor = items[0][0]
+            texts = [item[1] for item in items]
+            review_ids = [item[2] for item in items]
+            logger.info(f"Analyzing {len(items)} webhook review(s) in one processor call")
+            try:
+                result = await processor.process_reviews(texts, review_ids)
+            except Exception as e:
+                for *_, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            if not result.is_success():
+                for *_, future in items:
+                    if not future.done():
+                        future.set_result(result)
+                continue
+
+            reviews_by_id = {
+                review.get("review_id"): review
+                for review in result.value.get("reviews", [])
+            }
+            for _, _, review_id, future in items:
+                if future.done():
+                    continue
+                review = reviews_by_id.get(review_id)
+                if review is not None and "processing_error" in review:
+                    # A batch large enough for the processor to split gets
+                    # placeholder reviews for the parts the LLM failed on;
+                    # report those as errors, as a one-review call would
+                    future.set_result(Error(review["processing_error"]))
+                else:
+                    future.set_result(Success({"reviews": [review] if review else []}))
+
     def _check_active(self) -> Result[None]:
         """Return Success / Error if service is (not) configured."""
         if not self._active:
             return Error("Freshdesk service is not active - missing configuration")
-        return Success(None)
+        return Result.success(None)
     
     async def get_ticket(self, ticket_id: int) -> Result[Dict]:
         active_check = self._check_active()
         if not active_check.is_success():
             return active_check
 
+        cached = self._ticket_cache.get(ticket_id)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                logger.debug(f"Using cached ticket {ticket_id}")
+                return Success(cached[1])
+            del self._ticket_cache[ticket_id]
+
         url = f"{self.base_url}/tickets/{ticket_id}"
         params = None
-        headers = {"Content-Type": "application/json"}
 
         try:
-            async with aiohttp.ClientSession(auth=self.auth) as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    if response.status == 200:
-                        ticket = await response.json()
-                        return Success(ticket)
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get ticket {ticket_id}: {response.status} - {error_text}")
-                        return Error(f"Failed to get ticket: {response.status} - {error_text}")
+            status, body = await self._send("GET", url, params=params)
+            if status == 200:
+                # Decode the raw body in one step; response.json() would
+                # first build a str copy of the whole ticket
+                ticket = json_loads(body)
+                self._cache_ticket(ticket_id, ticket)
+                return Success(ticket)
+            else:
+                error_text = body.decode("utf-8", "replace")
+                logger.error(f"Failed to get ticket {ticket_id}: {status} - {error_text}")
+                return Error(f"Failed to get ticket: {status} - {error_text}")
         except Exception as e:
             logger.exception(f"Exception occurred while getting ticket {ticket_id}")
             return Error(f"Error getting ticket {ticket_id}: {str(e)}")
 
-    def _extract_clean_review_text(self, html_content: str) -> str:
-        if not html_content:
-            return ""
-        try:
-            soup = BeautifulSoup(html_content, "lxml")
-            original_request_div = soup.find("div", id="ticket_original_request")
-            if original_request_div:
-                quoted_text_span = original_request_div.find("span", class_="quoted-text")
-                if quoted_text_span:
-                    clean_text = quoted_text_span.get_text(separator=" ", strip=True)
-                    if clean_text:
-                        logger.info("Extracted review text from span.quoted-text")
-                        return clean_text
-            if original_request_div:
-                clean_text = original_request_div.get_text(separator=" ", strip=True)
-                if clean_text and len(clean_text) < 10000:
-                    logger.info("Extracted review text from div#ticket_original_request (fallback 1)")
-                    return clean_text
-            soup_raw = BeautifulSoup(html_content, "lxml")
-            for tag in soup_raw(["script", "style"]):
-                tag.decompose()
-            clean_text = soup_raw.get_text(separator=" ", strip=True)
-            logger.info("Extracted review text from raw HTML (fallback 2)")
-            return clean_text
-        except Exception as e:
-            logger.error(f"Error parsing HTML to extract review text: {e}", exc_info=True)
-            return html_content 
+    def _cache_ticket(self, ticket_id: int, ticket: Dict) -> None:
+        """Keep a fetched ticket for ticket_cache_ttl seconds (max 512 tickets)."""
+        ttl = self.cfg.ticket_cache_ttl
+        if ttl <= 0:
+            return
+        self._ticket_cache[ticket_id] = (time.monotonic() + ttl, ticket)
+        self._ticket_cache.move_to_end(ticket_id)
+        while len(self._ticket_cache) > _TICKET_CACHE_MAX:
+            self._ticket_cache.popitem(last=False)
 
-    def _format_note_body(self, clean_review_text: str, analysis: Dict) -> str:
+    def _extract_clean_review_text(self, html_content: str) -> str:
+        return _extract_review_text(html_content)
+
+    def _format_note_body(
+        self,
+        clean_review_text: str,
+        analysis: Dict,
+        rows_html: Markup,
+        counts: Dict[str, int],
+    ) -> str:
         context = {
             "original_text": clean_review_text,
-            "analysis": analysis
+            "analysis": analysis,
+            "rows_html": rows_html,
+            "counts": counts,
         }
         
         if freshdesk_note_template:
             try:
-                # Use the template with inline styles
-                return freshdesk_note_template.render(context)
+                return NOTE_HEADER_HTML + freshdesk_note_template.render(context) + NOTE_FOOTER_HTML
             except Exception as e:
                 logger.error(f"Error rendering Jinja2 template: {e}", exc_info=True)
         
@@ -149,9 +669,9 @@ class FreshdeskService:
             "<h4>Sentiment Analysis Results</h4>"
         ]
         if clean_review_text:
-            html_parts.append(f"<p><strong>Original Text:</strong><br>{clean_review_text}</p>")
+            html_parts.append(f"<p><strong>Original Text:</strong><br>{escape(clean_review_text)}</p>")
         if analysis and analysis.get("language"):
-            lang = analysis["language"].upper()
+            lang = escape(analysis["language"].upper())
             html_parts.append(
                 f'<p><strong>Language:</strong> '
                 f'<span style="display:inline-block; padding:2px 6px; '
@@ -160,23 +680,22 @@ class FreshdeskService:
             )
         labels = analysis.get("labels", [])
         if labels:
-            html_parts.append("<table border=\"1\" style=\"border-collapse: collapse; width: 100%; margin-top: 10px;\">")
-            html_parts.append("<tr><th>Category</th><th>Subcategory</th><th>Sentiment</th></tr>")
-            for label in labels:
-                category = label.get("category", "")
-                subcategory = label.get("subcategory", "")
-                sentiment = label.get("sentiment", "")
-                # Inline styles for fallback
-                style = "color: #546E7A; font-weight: bold;"
-                if sentiment.lower() == "positive": style = "color: #2E7D32; font-weight: bold;"
-                elif sentiment.lower() == "negative": style = "color: #C62828; font-weight: bold;"
-                html_parts.append(f"<tr><td>{category}</td><td>{subcategory}</td><td style=\"{style}\">{sentiment}</td></tr>")
-            html_parts.append("</table>")
+            rows = [
+                _fallback_label_row(
+                    label.get("category", ""),
+                    label.get("subcategory", ""),
+                    label.get("sentiment", ""),
+                )
+                for label in labels
+            ]
+            html_parts.extend((_FALLBACK_TABLE_OPEN, "".join(rows), "</table>"))
         else:
              html_parts.append("<p>No specific labels identified.</p>")
-        html_parts.append("<details style=\"margin-top: 15px;\"><summary>View raw analysis data</summary>")
-        html_parts.append(f"<pre>{json.dumps(analysis, indent=2)}</pre></details>")
-        html_parts.append("</div>")
+        html_parts.extend((
+            "<details style=\"margin-top: 15px;\"><summary>View raw analysis data</summary>",
+            f"<pre>{escape(json_dumps(analysis, indent=True).decode('utf-8'))}</pre></details>",
+            "</div>",
+        ))
         return "".join(html_parts)
 
     async def update_ticket_with_analysis(self, ticket_id: int, clean_review_text: str, analysis: Dict) -> Result[Dict]:
@@ -185,63 +704,86 @@ class FreshdeskService:
             return active_check
             
         url = f"{self.base_url}/tickets/{ticket_id}"
-        headers = {"Content-Type": "application/json"}
 
-        labels = analysis.get("labels", [])
-        # tags = set()
-        def _clean_tag(raw: str) -> str:
-            cleaned = raw.replace(" ", "_").replace("&", "and").lower()
-            if len(cleaned) > self.cfg.max_tag_len:
-                logger.debug("Trimming tag '%s' → '%s'", cleaned, cleaned[: self.cfg.max_tag_len])
-            return cleaned[: self.cfg.max_tag_len]
-
-
-        tags: set[str] = set()
-        for label in labels:
-            category = label.get("category", "")
-            subcategory = label.get("subcategory", "")
-            sentiment = label.get("sentiment", "")
-            if category:
-                tags.add(_clean_tag(f"cat_{category}"))
-            if subcategory:
-                tags.add(_clean_tag(f"sub_{subcategory}"))
-            if sentiment:
-                tags.add(_clean_tag(f"sent_{sentiment}"))
-
-        update_payload = {"tags": list(tags)}
-
-        note_html_body = self._format_note_body(clean_review_text, analysis)
+        # One pass over the labels yields the tags and the note table rows
+        tags, rows_html, counts = _scan_labels(
+            analysis.get("labels", []), self.cfg.max_tag_len
+        )
+
+        update_payload = {"tags": tags}
+
+        note_html_body = self._format_note_body(clean_review_text, analysis, rows_html, counts)
         note_payload = {"body": note_html_body, "private": True}
 
+        note_url = f"{self.base_url}/tickets/{ticket_id}/notes"
+
+        async def _put_tags() -> Tuple[int, str]:
+            status, body = await self._send("PUT", url, data=tags_body)
+            return status, body.decode("utf-8", "replace")
+
+        async def _post_note() -> Tuple[int, str]:
+            status, body = await self._send("POST", note_url, data=note_body)
+            return status, body.decode("utf-8", "replace")
+
         try:
-            async with aiohttp.ClientSession(auth=self.auth) as session:
-                if update_payload.get("tags"):
-                    # Corrected f-string syntax using single quotes for dictionary key
-                    logger.info(f"Attempting to update ticket {ticket_id} tags: {update_payload['tags']}") 
-                    async with session.put(url, json=update_payload, headers=headers) as response:
-                        if response.status == 200:
-                            logger.info(f"Successfully updated tags for ticket {ticket_id}")
-                        else:
-                            error_text = await response.text()
-                            logger.warning(f"Failed to update tags for ticket {ticket_id}: {response.status} - {error_text}")
+            # Serialize up front so aiohttp sends the bytes as-is
+            tags_body = json_dumps(update_payload)
+            note_body = json_dumps(note_payload)
+            # The tag update and the note are independent, so send them together
+            requests = [_post_note()]
+            if update_payload.get("tags"):
+                logger.info(f"Attempting to update ticket {ticket_id} tags: {update_payload['tags']}")
+                requests.append(_put_tags())
+            else:
+                logger.info(f"No tags generated to update for ticket {ticket_id}.")
+            logger.info(f"Attempting to add analysis note to ticket {ticket_id}")
+
+            note_result, *tag_results = await asyncio.gather(*requests, return_exceptions=True)
+
+            failure: Optional[BaseException] = None
+            for tag_result in tag_results:
+                if isinstance(tag_result, BaseException):
+                    logger.error(f"Exception while updating tags for ticket {ticket_id}", exc_info=tag_result)
+                    failure = tag_result
+                elif tag_result[0] == 200:
+                    logger.info(f"Successfully updated tags for ticket {ticket_id}")
                 else:
-                    logger.info(f"No tags generated to update for ticket {ticket_id}.")
-                        
-                note_url = f"{self.base_url}/tickets/{ticket_id}/notes"
-                logger.info(f"Attempting to add analysis note to ticket {ticket_id}")
-                async with session.post(note_url, json=note_payload, headers=headers) as note_response:
-                    if note_response.status == 201:
-                        logger.info(f"Successfully added analysis note to ticket {ticket_id}")
-                    else:
-                        note_error_text = await note_response.text()
-                        logger.warning(f"Failed to add note to ticket {ticket_id}: {note_response.status} - {note_error_text}")
-                
-                return Success({"message": f"Processed ticket {ticket_id}. Check ticket for updates and notes."}) 
+                    logger.warning(f"Failed to update tags for ticket {ticket_id}: {tag_result[0]} - {tag_result[1]}")
+
+            if isinstance(note_result, BaseException):
+                logger.error(f"Exception while adding note to ticket {ticket_id}", exc_info=note_result)
+                failure = note_result
+            elif note_result[0] == 201:
+                logger.info(f"Successfully added analysis note to ticket {ticket_id}")
+            else:
+                logger.warning(f"Failed to add note to ticket {ticket_id}: {note_result[0]} - {note_result[1]}")
+
+            if failure is not None:
+                return Error(f"Error updating ticket {ticket_id}: {str(failure)}")
+            return Success({"message": f"Processed ticket {ticket_id}. Check ticket for updates and notes."}) 
 
         except Exception as e:
             logger.exception(f"Exception occurred while updating ticket {ticket_id}")
             return Error(f"Error updating ticket {ticket_id}: {str(e)}")
 
+    def _get_cached_analysis(self, key: str) -> Optional[Dict]:
+        """Return a private copy of the cached analysis for the text hash, if any."""
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            return None
+        self._analysis_cache.move_to_end(key)
+        return copy.deepcopy(analysis)
+
+    def _store_cached_analysis(self, key: str, analysis: Dict) -> None:
+        """Cache a successful analysis, evicting the least recently used beyond the cap."""
+        max_size = self.cfg.analysis_cache_size
+        if max_size <= 0 or "processing_error" in analysis:
+            return
+        self._analysis_cache[key] = copy.deepcopy(analysis)
+        self._analysis_cache.move_to_end(key)
+        while len(self._analysis_cache) > max_size:
+            self._analysis_cache.popitem(last=False)
+
     async def process_ticket_reviews(self, processor: ReviewProcessor, ticket_id: int, raw_html_description: Optional[str] = None) -> Result[Dict]:
         active_check = self._check_active()
         if not active_check.is_success():
@@ -261,25 +803,45 @@ class FreshdeskService:
             logger.warning(f"Ticket {ticket_id} has no HTML description. Skipping analysis.")
             return Error("Ticket has no HTML description")
         
-        clean_review_text = self._extract_clean_review_text(raw_html_description)
+        if len(raw_html_description) < _SMALL_DESCRIPTION_LEN:
+            clean_review_text = self._extract_clean_review_text(raw_html_description)
+        else:
+            # Large descriptions go through lxml; parse them in a worker thread
+            # so other webhooks keep running meanwhile
+            clean_review_text = await asyncio.to_thread(
+                self._extract_clean_review_text, raw_html_description
+            )
         if not clean_review_text:
              logger.warning(f"Could not extract clean review text from HTML for ticket {ticket_id}. Skipping analysis.")
              return Error("Could not extract clean review text from HTML")
 
         review_id = f"fd_{ticket_id}"
-        logger.info(f"Sending cleaned ticket {ticket_id} description (length: {len(clean_review_text)}) for analysis.")
-        analysis_result = await processor.process_reviews([clean_review_text], [review_id])
-        
-        if not analysis_result.is_success():
-            logger.error(f"Analysis failed for ticket {ticket_id}: {analysis_result.error}")
-            return analysis_result
-        
-        processed_reviews = analysis_result.value.get("reviews", [])
-        if not processed_reviews:
-             logger.warning(f"Analysis returned no processed reviews for ticket {ticket_id}.")
-             analysis_data = {"review_id": review_id, "review_text": clean_review_text, "labels": [], "language": "unknown" }
+        cache_key = hashlib.sha256(clean_review_text.encode("utf-8")).hexdigest()
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            logger.info(
+                f"Reusing cached analysis for ticket {ticket_id}",
+                extra={"ticket_id": ticket_id, "cache_hit": True},
+            )
+            analysis_data = {**cached, "review_id": review_id}
         else:
-            analysis_data = processed_reviews[0]
+            logger.info(
+                f"Sending cleaned ticket {ticket_id} description (length: {len(clean_review_text)}) for analysis.",
+                extra={"ticket_id": ticket_id, "cache_hit": False},
+            )
+            analysis_result = await self._analyze(processor, clean_review_text, review_id)
+            
+            if not analysis_result.is_success():
+                logger.error(f"Analysis failed for ticket {ticket_id}: {analysis_result.error}")
+                return analysis_result
+            
+            processed_reviews = analysis_result.value.get("reviews", [])
+            if not processed_reviews:
+                logger.warning(f"Analysis returned no processed reviews for ticket {ticket_id}.")
+                analysis_data = {"review_id": review_id, "review_text": clean_review_text, "labels": [], "language": "unknown" }
+            else:
+                analysis_data = processed_reviews[0]
+                self._store_cached_analysis(cache_key, analysis_data)
 
         update_result = await self.update_ticket_with_analysis(ticket_id, clean_review_text, analysis_data)
         return update_result
@@ -337,7 +899,7 @@ class FreshdeskService:
         Returns:
             bool: True if signature is valid or if no webhook_secret is configured
         """
-        if not self.settings or not self.settings.webhook_secret:
+        if not self._secret_bytes:
             # If no secret configured, skip validation (development mode)
             return True
 
@@ -347,16 +909,16 @@ class FreshdeskService:
                 logger.warning("No X-Freshdesk-Signature header in request")
                 return False
 
-            import hmac
-            import hashlib
-            calculated_signature = hmac.new(
-                self.settings.webhook_secret.encode("utf-8"),
-                body,
-                hashlib.sha256
-            ).hexdigest()
+            try:
+                received_digest = bytes.fromhex(received_signature)
+            except ValueError:
+                logger.warning("X-Freshdesk-Signature header is not a hex digest")
+                return False
 
-            return hmac.compare_digest(calculated_signature, received_signature)
+            # hmac.digest is the one-shot C implementation (no HMAC object)
+            calculated_digest = hmac.digest(self._secret_bytes, body, "sha256")
+            return hmac.compare_digest(calculated_digest, received_digest)
 
         except Exception as e:
             logger.exception(f"Error validating webhook signature: {str(e)}")
-            return False
\ No newline at end of file
+            return False
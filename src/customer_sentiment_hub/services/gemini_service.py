@@ -1,7 +1,10 @@
 """Gemini LLM service implementation."""
 
+import json
 import logging
-from typing import Dict, List, Optional
+import re
+import time
+from typing import Any, Dict, List, Optional
 from langdetect import detect, LangDetectException
 
 from google.cloud import aiplatform
@@ -12,12 +15,44 @@ from customer_sentiment_hub.config.settings import GeminiSettings, GoogleCloudSe
 from customer_sentiment_hub.domain.schema import ReviewOutput
 from customer_sentiment_hub.domain.validation import ValidationService
 from customer_sentiment_hub.prompts.formatters import format_reviews_for_prompt
-from customer_sentiment_hub.prompts.templates import get_populated_prompt
+from customer_sentiment_hub.prompts.templates import get_prompt_parts
 from customer_sentiment_hub.services.llm_service import LLMService
 from customer_sentiment_hub.utils.result import Result, Success, Error
 
 logger = logging.getLogger(__name__)
 
+# How long a successful connection test is trusted before Vertex AI is called again
+_CONNECTION_CHECK_TTL = 30.0
+
+# Fenced ```json block in a model response
+_JSON_FENCE_RE = re.compile(r"```json\s*([\s\S]*?)\s*```")
+
+
+def _extract_json(text: str) -> Any:
+    """
+    Extract the JSON payload from a model response.
+
+    A fenced ```json block wins; otherwise the text between the first ``{``
+    and the last ``}`` is parsed.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        Any: The decoded JSON value
+
+    Raises:
+        ValueError: If no JSON could be found or decoded
+    """
+    match = _JSON_FENCE_RE.search(text)
+    if match:
+        return json.loads(match.group(1))
+    json_start = text.find("{")
+    json_end = text.rfind("}") + 1
+    if json_start >= 0 and json_end > json_start:
+        return json.loads(text[json_start:json_end])
+    raise ValueError("Could not extract JSON from response")
+
 
 class GeminiService(LLMService):
     """Service for interacting with Google's Gemini models."""
@@ -56,6 +91,13 @@ class GeminiService(LLMService):
         
         # Initialize the parser
         self.parser = PydanticOutputParser(pydantic_object=ReviewOutput)
+
+        # Everything around the reviews is constant, so the prompt is
+        # assembled by concatenation instead of a template format per call
+        self._prompt_prefix, self._prompt_suffix = get_prompt_parts()
+
+        # monotonic time of the last successful test_connection, if any
+        self._last_connection_ok: Optional[float] = None
         
         logger.info(
             f"Initialized Gemini service with model {gemini_settings.model_name}"
@@ -65,17 +107,26 @@ class GeminiService(LLMService):
         """
         Test connection to Gemini API.
         
+        A success is reused for 30 seconds so frequent health checks don't
+        each cost a Vertex AI request; failures are never cached.
+
         Returns:
             bool: True if connection is successful, raises an exception otherwise
         """
+        last_ok = self._last_connection_ok
+        if last_ok is not None and time.monotonic() - last_ok < _CONNECTION_CHECK_TTL:
+            return True
+
+        self._last_connection_ok = None
         try:
             # Simple test to check if Gemini API is accessible
             # Use a minimal prompt that requires minimal tokens and processing
-            test_response = self.llm.invoke("Hello, are you available?")
+            test_response = await self.llm.ainvoke("Hello, are you available?")
             
             # If we get a response, connection is successful
             if test_response and hasattr(test_response, 'content'):
                 logger.info("Gemini API connection test successful")
+                self._last_connection_ok = time.monotonic()
                 return True
             else:
                 logger.error("Gemini API connection test failed: No response content")
@@ -100,22 +151,28 @@ class GeminiService(LLMService):
             # Format the reviews for the prompt
             reviews_text = format_reviews_for_prompt(review_texts)
             
-            # Get the populated prompt
-            prompt = get_populated_prompt(reviews_text)
-            
-            # Format the prompt
-            formatted_prompt = prompt.format(reviews=reviews_text)
+            # Build the prompt around the constant instructions
+            formatted_prompt = self._prompt_prefix + reviews_text + self._prompt_suffix
             
-            # Send request to Gemini
-            response = self.llm.invoke(formatted_prompt)
+            # Send request to Gemini without blocking the event loop
+            response = await self.llm.ainvoke(formatted_prompt)
             response_text = response.content
             
             logger.debug(f"Received response of length {len(response_text)}")
             
+            # Decode the JSON once; both the Pydantic path and the fallback use it
+            try:
+                parsed_json = _extract_json(response_text)
+            except ValueError:
+                parsed_json = None
+
             # Parse the output
             try:
-                # Try to parse with Pydantic
-                output = self.parser.parse(response_text)
+                # Try to validate with Pydantic (the parser also accepts partial JSON)
+                if parsed_json is not None:
+                    output = ReviewOutput.model_validate(parsed_json)
+                else:
+                    output = self.parser.parse(response_text)
                 
                 # Update review_ids to match input order
                 for i, review in enumerate(output.reviews):
@@ -135,27 +192,9 @@ class GeminiService(LLMService):
                 logger.warning(f"Error parsing response: {str(e)}")
                 
                 try:
-                    import json
-                    import re
-                    
-                    # Try to find JSON using a regex pattern
-                    json_pattern = r'```json\s*([\s\S]*?)\s*```'
-                    match = re.search(json_pattern, response_text)
-                    if match:
-                        json_str = match.group(1)
-                        parsed_json = json.loads(json_str)
-                    else:
-                        # Try to find JSON using braces
-                        json_start = response_text.find('{')
-                        json_end = response_text.rfind('}') + 1
-                        
-                        if json_start >= 0 and json_end > json_start:
-                            json_str = response_text[json_start:json_end]
-                            parsed_json = json.loads(json_str)
-                        else:
-                            raise ValueError("Could not extract JSON from response")
-                    
-                   
+                    if parsed_json is None:
+                        raise ValueError("Could not extract JSON from response")
+
                     if "reviews" not in parsed_json:
                         restructured = {"reviews": []}
                         
@@ -237,15 +276,14 @@ class GeminiService(LLMService):
             Dict: Cleaned results
         """
         if "reviews" in results:
+            validate = self.validation_service.validate_and_fix_label
             for review in results["reviews"]:
                 # 1) guarantee ≥1 label
-                self._ensure_at_least_one_label(review)
+                if not review.get("labels"):
+                    self._ensure_at_least_one_label(review)
     
-                # 2) validate / fix every label
-                review["labels"] = [
-                    self.validation_service.validate_and_fix_label(lbl)
-                    for lbl in review["labels"]
-                ]
+                # 2) validate / fix every label; valid labels come back as-is
+                review["labels"] = [validate(lbl) for lbl in review["labels"]]
 
                 if (
                     "language" not in review
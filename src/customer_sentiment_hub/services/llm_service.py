@@ -35,4 +35,13 @@ class LLMService(ABC):
         Returns:
             bool: True if connection is successful, raises an exception otherwise
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def aclose(self) -> None:
+        """
+        Release client resources held by the service.
+
+        Implementations create their client once and reuse it for every
+        call; override this if that client needs closing on shutdown.
+        """
+        pass
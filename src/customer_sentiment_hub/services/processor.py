@@ -1,19 +1,45 @@
 """Review processing service."""
 
 import asyncio
-import json
+import copy
+import hashlib
 import logging
 import os
 import re
+import time
 import demoji
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Iterator, List, Dict, Optional, Tuple, cast
 
 from customer_sentiment_hub.config.settings import ProcessingSettings
 from customer_sentiment_hub.services.llm_service import LLMService
+from customer_sentiment_hub.utils.helpers import json_dumps, json_loads
+from customer_sentiment_hub.utils.rate_limit import AsyncTokenBucket
 from customer_sentiment_hub.utils.result import Result, Success, Error
 
 logger = logging.getLogger(__name__)
 
+# Output file suffixes that select line-delimited results in process_from_file
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# Label given to every review of a batch the LLM failed to analyze
+_FAIL_LABEL = MappingProxyType({
+    "category": "Miscellaneous",
+    "subcategory": "Other",
+    "sentiment": "Neutral",
+    "error": "Processing failed",
+})
+
+
+# Label given locally to reviews too short or bare to send to the LLM
+_EMPTY_LABEL = MappingProxyType({
+    "category": "Miscellaneous",
+    "subcategory": "Other",
+    "sentiment": "Neutral",
+})
+
 
 class ReviewProcessor:
     """Service for processing customer reviews."""
@@ -32,11 +58,32 @@ class ReviewProcessor:
         """
         self.llm_service = llm_service
         self.settings = settings
+
+        # Analyses of recently seen texts, keyed by _review_cache_key, oldest first
+        self._review_cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+        # Batch size in use; tuned between runs when adaptive_batch_size is set
+        self.batch_size = settings.batch_size
+        self._batch_latency: Optional[float] = None  # smoothed seconds per batch
+
+        # Optional client-side pacing so requests stay inside the LLM quota
+        self._request_limiter = (
+            AsyncTokenBucket(settings.requests_per_minute)
+            if settings.requests_per_minute > 0 else None
+        )
+        self._token_limiter = (
+            AsyncTokenBucket(settings.tokens_per_minute)
+            if settings.tokens_per_minute > 0 else None
+        )
         
         logger.info(
             f"Initialized ReviewProcessor with batch size {settings.batch_size}"
         )
     
+    async def aclose(self) -> None:
+        """Close the LLM service this processor sends reviews to."""
+        await self.llm_service.aclose()
+
     async def process_single_review(self, review_text: str, review_id: Optional[str] = None) -> Result[Dict]:
         """
         Process a single review.
@@ -75,29 +122,178 @@ class ReviewProcessor:
                 return Error("Number of review IDs must match number of review texts")
         else:
             # Generate sequential IDs for backward compatibility
-            review_ids = [f"{1000 + i}" for i in range(len(review_texts))]
+            review_ids = _default_review_ids(len(review_texts))
         
         # Preprocess all review texts to handle emojis
         preprocessed_texts = [preprocess_review_text(text) for text in review_texts]
+
+        # Send each distinct text to the LLM once; preprocessing already
+        # collapsed whitespace, so duplicates differ at most in case
+        first_index: Dict[str, int] = {}
+        positions: List[int] = []
+        unique_texts: List[str] = []
+        unique_ids: List[str] = []
+        for text, review_id in zip(preprocessed_texts, review_ids):
+            key = text.casefold()
+            position = first_index.get(key)
+            if position is None:
+                position = first_index[key] = len(unique_texts)
+                unique_texts.append(text)
+                unique_ids.append(review_id)
+            positions.append(position)
         
-        if len(preprocessed_texts) <= self.settings.batch_size:
+        # Label texts with nothing to analyze locally, and reuse analyses of
+        # texts seen in earlier requests
+        min_chars = self.settings.min_review_chars
+        unique_reviews: List[Optional[Dict]] = [
+            _empty_review(text)
+            if min_chars > 0 and _is_empty_review(text, min_chars)
+            else self._get_cached_review(text)
+            for text in unique_texts
+        ]
+        misses = [i for i, review in enumerate(unique_reviews) if review is None]
+
+        if len(misses) == len(preprocessed_texts):
+            # Nothing cached or repeated: analyze the reviews as given
+            result = await self._analyze_uncached(unique_texts, unique_ids)
+            if result.is_success():
+                self._store_cached_reviews(
+                    unique_texts, unique_ids, result.value.get("reviews", [])
+                )
+            return result
+
+        output: Dict = {"reviews": []}
+        if misses:
+            miss_texts = [unique_texts[i] for i in misses]
+            miss_ids = [unique_ids[i] for i in misses]
+            result = await self._analyze_uncached(miss_texts, miss_ids)
+            if not result.is_success():
+                return result
+            output = result.value
+            miss_reviews = output.get("reviews", [])
+            for i, review in zip(misses, miss_reviews):
+                unique_reviews[i] = review
+            self._store_cached_reviews(miss_texts, miss_ids, miss_reviews)
+
+        logger.info(
+            f"Analyzed {len(misses)} new texts for {len(preprocessed_texts)} reviews "
+            f"({len(unique_texts) - len(misses)} cached or empty)"
+        )
+        output["reviews"] = _fan_out_reviews(
+            unique_reviews, positions, review_ids, preprocessed_texts
+        )
+        return Success(output)
+
+    async def _analyze_uncached(self, review_texts: List[str], review_ids: List) -> Result[Dict]:
+        """Analyze reviews directly or in batches, depending on how many there are."""
+        if len(review_texts) <= self.batch_size:
             # Process directly if the batch is small enough
-            result = await self.llm_service.analyze_reviews(preprocessed_texts)
+            result = await self._analyze(review_texts)
             
             # Update review IDs if successful
             if result.is_success() and "reviews" in result.value:
-                for i, review in enumerate(result.value["reviews"]):
-                    if i < len(review_ids):
-                        review["review_id"] = review_ids[i]
-                        
+                for review, review_id in zip(result.value["reviews"], review_ids):
+                    review["review_id"] = review_id
             return result
-        else:
-            # Process in batches for larger sets
-            return await self._process_in_batches(preprocessed_texts, review_ids)
+        # Process in batches for larger sets
+        return await self._process_in_batches(review_texts, review_ids)
+
+    def _adapt_batch_size(self, latencies: List[float], failed: int) -> None:
+        """
+        Tune the batch size for the next run from how this run's batches went.
+
+        Any failed batch halves the size. Otherwise the smoothed batch latency
+        decides: below ``target_batch_latency`` the size grows by a quarter (up
+        to ``max_batch_size``), above twice the target it is halved.
+
+        Args:
+            latencies: Seconds taken by each successful batch
+            failed: Number of batches that failed
+        """
+        size = self.batch_size
+        if failed:
+            size = max(1, size // 2)
+        elif latencies:
+            latency = sum(latencies) / len(latencies)
+            if self._batch_latency is not None:
+                latency = 0.8 * self._batch_latency + 0.2 * latency
+            self._batch_latency = latency
+            target = self.settings.target_batch_latency
+            if latency < target:
+                size = min(self.settings.max_batch_size, max(size + 1, int(size * 1.25)))
+            elif latency > 2 * target:
+                size = max(1, size // 2)
+
+        if size != self.batch_size:
+            logger.info(f"Batch size changed from {self.batch_size} to {size}")
+            self.batch_size = size
+
+    def _get_cached_review(self, text: str) -> Optional[Dict]:
+        """Return a private copy of the cached analysis for text, if any."""
+        if not self._review_cache:
+            return None
+        key = _review_cache_key(text)
+        review = self._review_cache.get(key)
+        if review is None:
+            return None
+        self._review_cache.move_to_end(key)
+        return copy.deepcopy(review)
+
+    def _store_cached_reviews(
+        self, review_texts: List[str], review_ids: List, reviews: List[Dict]
+    ) -> None:
+        """
+        Remember fresh analyses, but only if they line up with the texts sent.
+
+        Reviews are matched to texts by position, so when the LLM returned a
+        different number of reviews, or a review carries another text's ID,
+        nothing is cached rather than risk caching one text's labels under
+        another's key.
+        """
+        if self.settings.result_cache_size <= 0:
+            return
+        if len(reviews) != len(review_texts) or any(
+            review.get("review_id") != review_id
+            for review, review_id in zip(reviews, review_ids)
+        ):
+            logger.warning(
+                f"Not caching analyses: got {len(reviews)} reviews for "
+                f"{len(review_texts)} texts, or their IDs do not match"
+            )
+            return
+        for text, review in zip(review_texts, reviews):
+            self._store_cached_review(text, review)
+
+    def _store_cached_review(self, text: str, review: Dict) -> None:
+        """Remember a successful analysis, evicting the least recently used."""
+        max_size = self.settings.result_cache_size
+        if max_size <= 0 or "processing_error" in review:
+            return
+        self._review_cache[_review_cache_key(text)] = copy.deepcopy(review)
+        while len(self._review_cache) > max_size:
+            self._review_cache.popitem(last=False)
     
+    async def _analyze(self, review_texts: List[str]) -> Result[Dict]:
+        """
+        Send one batch to the LLM service, waiting for quota first.
+
+        Token usage is estimated as four characters per token of review
+        text; the constant prompt is not counted.
+        """
+        if self._request_limiter is not None:
+            await self._request_limiter.acquire()
+        if self._token_limiter is not None:
+            await self._token_limiter.acquire(sum(len(text) // 4 for text in review_texts))
+        return await self.llm_service.analyze_reviews(review_texts)
+
     async def _process_in_batches(self, review_texts: List[str], review_ids: List[str]) -> Result[Dict]:
         """
         Process reviews in batches.
+
+        Batches are sent to the LLM service concurrently, at most
+        ``max_concurrent_batches`` at a time, and reassembled in input order.
+        Failed batches get placeholder reviews, unless ``fail_fast`` is set,
+        in which case the first failure cancels the rest and is returned.
         
         Args:
             review_texts: List of review texts to process
@@ -106,54 +302,74 @@ class ReviewProcessor:
         Returns:
             Result containing all processed reviews or error
         """
-        # Initialize result with empty reviews list
-        final_result = {"reviews": []}
-        
-        # Process in batches
-        num_batches = (len(review_texts) + self.settings.batch_size - 1) // self.settings.batch_size
+        batch_size = self.batch_size
+        num_batches = (len(review_texts) + batch_size - 1) // batch_size
         
         logger.info(f"Processing {len(review_texts)} reviews in {num_batches} batches")
-        
-        for i in range(0, len(review_texts), self.settings.batch_size):
-            batch_number = i // self.settings.batch_size + 1
-            logger.info(f"Processing batch {batch_number}/{num_batches}")
-            
-            # Get current batch of texts and IDs
-            batch_texts = review_texts[i:i + self.settings.batch_size]
-            batch_ids = review_ids[i:i + self.settings.batch_size]
-            
-            # Process batch
-            batch_result = await self.llm_service.analyze_reviews(batch_texts)
-            
-            if batch_result.is_success():
-                # Update review IDs to preserve user-provided IDs
-                batch_data = batch_result.value
-                if "reviews" in batch_data:
-                    for j, review in enumerate(batch_data["reviews"]):
-                        if j < len(batch_ids):
-                            review["review_id"] = batch_ids[j]
-                    
-                    # Add to final result
-                    final_result["reviews"].extend(batch_data["reviews"])
-            else:
-                # Handle error case
-                error_msg = f"Error processing batch {batch_number}: {batch_result.error}"
-                logger.error(error_msg)
-                
-                # Add placeholder entries for failed batch
-                for j, (text, review_id) in enumerate(zip(batch_texts, batch_ids)):
-                    final_result["reviews"].append({
-                        "review_id": review_id,  # Use the provided ID
-                        "text": text,
-                        "labels": [{
-                            "category": "Miscellaneous",
-                            "subcategory": "Other",
-                            "sentiment": "Neutral",
-                            "error": "Processing failed"
-                        }],
-                        "processing_error": error_msg
-                    })
-        
+
+        # Slice each batch only when it is sent, instead of copying them all up front
+        batch_starts = range(0, len(review_texts), batch_size)
+        semaphore = asyncio.Semaphore(max(1, self.settings.max_concurrent_batches))
+        # Log progress about 20 times per run, however many batches there are
+        log_every = max(1, num_batches // 20)
+
+        stopped = asyncio.Event()
+        latencies: List[float] = []
+
+        async def _run_batch(batch_number: int, start: int) -> List[Dict]:
+            async with semaphore:
+                if stopped.is_set():
+                    return []  # an earlier batch failed and the run is stopping
+                if batch_number % log_every == 0 or batch_number == num_batches:
+                    logger.info("Processing batch %d/%d", batch_number, num_batches)
+                batch_texts = review_texts[start:start + batch_size]
+                batch_ids = review_ids[start:start + batch_size]
+                started = time.monotonic()
+                try:
+                    result = await self._analyze(batch_texts)
+                except Exception as e:
+                    result = Error(str(e))
+
+            if result.is_success():
+                latencies.append(time.monotonic() - started)
+                # Stamp the IDs now, while other batches are still waiting on the LLM
+                return list(_with_review_ids(result.value.get("reviews", []), batch_ids))
+
+            failure = cast(Error[Dict], result)
+            if self.settings.fail_fast:
+                stopped.set()
+                raise _BatchFailed(batch_number, failure.error)
+
+            error_msg = f"Error processing batch {batch_number}: {failure.error}"
+            logger.error(error_msg)
+            return _failed_batch_reviews(batch_texts, batch_ids, error_msg)
+
+        tasks = [
+            asyncio.create_task(_run_batch(number, start))
+            for number, start in enumerate(batch_starts, start=1)
+        ]
+        try:
+            if self.settings.fail_fast:
+                # Stop spending quota on the other batches once one has failed
+                for finished in asyncio.as_completed(tasks):
+                    try:
+                        await finished
+                    except _BatchFailed as e:
+                        error_msg = f"Stopped after a failed batch: {e}"
+                        logger.error(error_msg)
+                        return Error(error_msg)
+            batch_reviews = await asyncio.gather(*tasks)
+        finally:
+            # Cancel whatever is still running if we stop early or are cancelled
+            for task in tasks:
+                task.cancel()
+
+        # Batches finish in any order; their reviews are joined in input order
+        final_result = {"reviews": list(chain.from_iterable(batch_reviews))}
+
+        if self.settings.adaptive_batch_size:
+            self._adapt_batch_size(latencies, failed=num_batches - len(latencies))
+
         logger.info(f"Completed processing {len(review_texts)} reviews")
         return Success(final_result)
     
@@ -163,59 +379,29 @@ class ReviewProcessor:
         """
         Process reviews from a file and save results.
         
+        When output_path ends in ``.ndjson`` or ``.jsonl`` the results are
+        written one review per line as each group of batches completes, and
+        only a summary is returned, so memory stays bounded for large files.
+        
         Args:
             file_path: Path to the input file (JSON or TXT)
             output_path: Path to save the results (default: input_file_results.json)
             
         Returns:
-            Result containing processed reviews or error
+            Result containing processed reviews (or, for NDJSON output, the
+            review count and output path) or error
         """
         try:
-            # Determine file type and load reviews
-            review_texts = []
-            review_ids = []
-            
-            if file_path.endswith('.json'):
-                # Load reviews from JSON
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Extract review texts and IDs
-                if isinstance(data, list):
-                    # Check if list contains objects with review_id and review_text
-                    if data and isinstance(data[0], dict) and 'review_id' in data[0] and 'review_text' in data[0]:
-                        review_ids = [item['review_id'] for item in data]
-                        review_texts = [item['review_text'] for item in data]
-                    else:
-                        # Treat list items as review texts
-                        review_texts = data
-                elif isinstance(data, dict):
-                    if 'reviews' in data:
-                        # New format with reviews array
-                        if data['reviews'] and isinstance(data['reviews'][0], dict):
-                            if 'review_id' in data['reviews'][0] and 'review_text' in data['reviews'][0]:
-                                # New format with review_id and review_text
-                                review_ids = [item['review_id'] for item in data['reviews']]
-                                review_texts = [item['review_text'] for item in data['reviews']]
-                            elif 'text' in data['reviews'][0]:
-                                # Old format with text field
-                                review_texts = [r.get('text', '') for r in data['reviews'] if 'text' in r]
-                    else:
-                        # Handle key-value pairs as reviews
-                        review_texts = []
-                        for key, value in data.items():
-                            if isinstance(value, str):
-                                review_ids.append(key)
-                                review_texts.append(value)
-            else:
-                # Load reviews from text file (one per line)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    review_texts = [line.strip() for line in f if line.strip()]
+            # File reads and JSON parsing block, so keep them off the event loop
+            review_ids, review_texts = await asyncio.to_thread(_load_reviews, file_path)
             
             if not review_texts:
                 return Error(f"No reviews found in {file_path}")
             
             logger.info(f"Loaded {len(review_texts)} reviews from {file_path}")
+
+            if output_path is not None and output_path.endswith(_NDJSON_SUFFIXES):
+                return await self._process_to_ndjson(review_texts, review_ids, output_path)
             
             # Process reviews
             result = await self.process_reviews(review_texts, review_ids if review_ids else None)
@@ -226,8 +412,7 @@ class ReviewProcessor:
                     base_name = os.path.splitext(os.path.basename(file_path))[0]
                     output_path = f"{base_name}_results.json"
                 
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(result.value, f, indent=2)
+                await asyncio.to_thread(_save_results, output_path, result.value)
                 
                 logger.info(f"Results saved to {output_path}")
             
@@ -238,6 +423,212 @@ class ReviewProcessor:
             logger.error(error_msg)
             return Error(error_msg)
 
+    async def _process_to_ndjson(
+        self, review_texts: List[str], review_ids: List, output_path: str
+    ) -> Result[Dict]:
+        """
+        Process reviews in groups and append each group's results to an NDJSON file.
+
+        A group is as many reviews as fit in the concurrent batches, so the
+        LLM stays busy while only one group's results are held in memory.
+        Results written before a failure are kept.
+
+        Args:
+            review_texts: List of review texts to process
+            review_ids: List of IDs for the reviews (may be empty)
+            output_path: Path of the NDJSON file to write
+
+        Returns:
+            Result containing the review count and output path, or error
+        """
+        if not review_ids:
+            # Number the reviews across the whole file, not per group
+            review_ids = _default_review_ids(len(review_texts))
+        group_size = self.batch_size * max(1, self.settings.max_concurrent_batches)
+
+        await asyncio.to_thread(_write_ndjson, output_path, [], "wb")
+        review_count = 0
+        for start in range(0, len(review_texts), group_size):
+            result = await self.process_reviews(
+                review_texts[start:start + group_size],
+                review_ids[start:start + group_size],
+            )
+            if not result.is_success():
+                return result
+            reviews = result.value.get("reviews", [])
+            await asyncio.to_thread(_write_ndjson, output_path, reviews, "ab")
+            review_count += len(reviews)
+
+        logger.info(f"Results for {review_count} reviews saved to {output_path}")
+        return Success({"review_count": review_count, "output_path": output_path})
+
+
+def _default_review_ids(count: int) -> List[str]:
+    """Sequential IDs ("1000", "1001", ...) for reviews submitted without IDs."""
+    return list(map(str, range(1000, 1000 + count)))
+
+
+class _BatchFailed(Exception):
+    """Raised by a batch task to stop the run when fail_fast is set."""
+
+    def __init__(self, batch_number: int, error: str):
+        super().__init__(f"batch {batch_number}: {error}")
+
+
+# Marks the end of the ID list in _with_review_ids
+_NO_ID = object()
+
+
+def _with_review_ids(reviews: List[Dict], review_ids: List) -> Iterator[Dict]:
+    """Yield reviews in order, setting review_id on each while IDs last."""
+    ids = iter(review_ids)
+    for review in reviews:
+        review_id = next(ids, _NO_ID)
+        if review_id is not _NO_ID:
+            review["review_id"] = review_id
+        yield review
+
+
+def _is_empty_review(text: str, min_chars: int) -> bool:
+    """True if text is shorter than min_chars or has no letters or digits."""
+    return len(text.strip()) < min_chars or not any(map(str.isalnum, text))
+
+
+def _empty_review(text: str) -> Dict:
+    """Review for a text with nothing to analyze; its ID is set on fan-out."""
+    return {"review_id": None, "text": text, "labels": [dict(_EMPTY_LABEL)]}
+
+
+def _failed_batch_reviews(
+    review_texts: List[str], review_ids: List, error_msg: str
+) -> List[Dict]:
+    """Placeholder reviews for a batch the LLM failed to analyze."""
+    return [
+        {
+            "review_id": review_id,  # Use the provided ID
+            "text": text,
+            "labels": [dict(_FAIL_LABEL)],
+            "processing_error": error_msg,
+        }
+        for text, review_id in zip(review_texts, review_ids)
+    ]
+
+
+def _review_cache_key(text: str) -> str:
+    """Content hash identifying a preprocessed review text in the result cache."""
+    return hashlib.blake2b(text.casefold().encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _fan_out_reviews(
+    unique_reviews: List[Optional[Dict]],
+    positions: List[int],
+    review_ids: List,
+    review_texts: List[str],
+) -> List[Dict]:
+    """
+    Expand results for distinct texts back to one review per original input.
+
+    Args:
+        unique_reviews: Processed reviews, one per distinct text (None
+            where no analysis came back)
+        positions: For each original review, the index of its distinct text
+        review_ids: Original review IDs
+        review_texts: Original (preprocessed) review texts
+
+    Returns:
+        List[Dict]: Reviews in input order; repeated texts get deep copies
+    """
+    reviews = []
+    used = set()
+    for position, review_id, text in zip(positions, review_ids, review_texts):
+        review = unique_reviews[position]
+        if review is None:
+            continue  # the LLM returned fewer reviews than it was sent
+        if position in used:
+            review = copy.deepcopy(review)
+        else:
+            used.add(position)
+        review["review_id"] = review_id
+        if "text" in review:
+            review["text"] = text
+        reviews.append(review)
+    return reviews
+
+
+def _unzip_reviews(items: List[Dict]) -> Tuple[List, List[str]]:
+    """Split review_id/review_text objects into parallel lists in one pass."""
+    review_ids = []
+    review_texts = []
+    for item in items:
+        review_ids.append(item['review_id'])
+        review_texts.append(item['review_text'])
+    return review_ids, review_texts
+
+
+def _load_reviews(file_path: str) -> Tuple[List, List[str]]:
+    """
+    Load review IDs and texts from a JSON or TXT file.
+    
+    Args:
+        file_path: Path to the input file (JSON or TXT)
+        
+    Returns:
+        Tuple of review IDs (empty when the file has none) and review texts
+    """
+    review_texts: List[str] = []
+    review_ids: List = []
+    
+    if file_path.endswith('.json'):
+        # Load reviews from JSON; the parser takes the raw UTF-8 bytes
+        with open(file_path, 'rb') as f:
+            data = json_loads(f.read())
+        
+        # Extract review texts and IDs
+        if isinstance(data, list):
+            # Check if list contains objects with review_id and review_text
+            if data and isinstance(data[0], dict) and 'review_id' in data[0] and 'review_text' in data[0]:
+                review_ids, review_texts = _unzip_reviews(data)
+            else:
+                # Treat list items as review texts
+                review_texts = data
+        elif isinstance(data, dict):
+            if 'reviews' in data:
+                reviews = data['reviews']
+                # New format with reviews array
+                if reviews and isinstance(reviews[0], dict):
+                    if 'review_id' in reviews[0] and 'review_text' in reviews[0]:
+                        # New format with review_id and review_text
+                        review_ids, review_texts = _unzip_reviews(reviews)
+                    elif 'text' in reviews[0]:
+                        # Old format with text field
+                        review_texts = [r['text'] for r in reviews if 'text' in r]
+            else:
+                # Handle key-value pairs as reviews
+                for key, value in data.items():
+                    if isinstance(value, str):
+                        review_ids.append(key)
+                        review_texts.append(value)
+    else:
+        # Load reviews from text file (one per line). Read it in one call and
+        # split on "\n" only: text mode already normalised line endings, and
+        # str.splitlines would also break on form feeds and U+2028
+        with open(file_path, 'r', encoding='utf-8') as f:
+            review_texts = list(filter(None, map(str.strip, f.read().split('\n'))))
+    
+    return review_ids, review_texts
+
+
+def _save_results(output_path: str, results: Dict) -> None:
+    """Write processing results to output_path as indented JSON."""
+    with open(output_path, 'wb') as f:
+        f.write(json_dumps(results, indent=True))
+
+
+def _write_ndjson(output_path: str, reviews: List[Dict], mode: str) -> None:
+    """Write reviews to output_path as one JSON document per line."""
+    with open(output_path, mode) as f:
+        f.write(b"".join(json_dumps(review) + b"\n" for review in reviews))
+
 
 def preprocess_review_text(text: str) -> str:
     """
@@ -37,9 +37,9 @@ def test_settings() -> AppSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validation_service() -> ValidationService:
-    """Create a validation service."""
+    """Create a validation service, shared by the session as it holds no state."""
     return ValidationService()
 
 
@@ -0,0 +1,503 @@
+"""
+Tests for the Freshdesk service.
+
+This module contains tests for the caching and analysis plumbing in
+FreshdeskService, run against fake processors instead of the Freshdesk API.
+"""
+
+import asyncio
+import dataclasses
+import os
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from customer_sentiment_hub.config.settings import FreshdeskSettings, ProcessingSettings
+from customer_sentiment_hub.services.freshdesk_service import (
+    FreshdeskService,
+    _extract_review_text,
+    _parse_review_text,
+)
+from customer_sentiment_hub.services.processor import ReviewProcessor
+from customer_sentiment_hub.utils.result import Error, Success
+
+
+class _FakeProcessor:
+    """Processor stand-in that labels every review and records its calls."""
+
+    def __init__(self, result=None, gate=None) -> None:
+        self.calls = []
+        self.result = result
+        self.gate = gate
+
+    async def process_reviews(self, texts, review_ids=None):
+        self.calls.append((list(texts), list(review_ids or [])))
+        if self.gate is not None:
+            await self.gate.wait()
+        if isinstance(self.result, Exception):
+            raise self.result
+        if self.result is not None:
+            return self.result
+        return Success({
+            "reviews": [
+                {"review_id": review_id, "review_text": text, "labels": [], "language": "en"}
+                for text, review_id in zip(texts, review_ids)
+            ]
+        })
+
+
+def _settings_from_clean_environment() -> FreshdeskSettings:
+    """Build FreshdeskSettings.from_environment() with no variables set."""
+    with patch.dict(os.environ, {}, clear=True):
+        return FreshdeskSettings.from_environment()
+
+
+def _service(**overrides) -> FreshdeskService:
+    """Build an active service that analyzes each webhook on its own."""
+    options = {"api_key": "key", "domain": "acme", "webhook_batch_size": 1}
+    options.update(overrides)
+    return FreshdeskService(FreshdeskSettings(**options))
+
+
+class _FakeResponse:
+    """Minimal aiohttp response for _send."""
+
+    def __init__(self, status, body=b"{}", headers=None) -> None:
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def read(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeSession:
+    """Session stand-in that replays a list of responses."""
+
+    closed = False
+
+    def __init__(self, responses) -> None:
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestDefaultSettings(unittest.TestCase):
+    """Test suite for a service built from an empty environment."""
+
+    def test_defaults_match_field_defaults(self):
+        """Test that from_environment() with nothing set equals the dataclass defaults."""
+        self.assertEqual(_settings_from_clean_environment(), FreshdeskSettings())
+
+    def test_service_from_clean_environment(self):
+        """Test that the default settings give a working request path."""
+        cfg = _settings_from_clean_environment()
+        self.assertFalse(FreshdeskService(cfg)._active)
+
+        service = FreshdeskService(dataclasses.replace(cfg, api_key="key", domain="acme"))
+        session = _FakeSession([
+            _FakeResponse(429, headers={"Retry-After": "0"}),
+            _FakeResponse(503),
+            _FakeResponse(200, b'{"id": 7}'),
+        ])
+        service._session = session
+        with patch(
+            "customer_sentiment_hub.services.freshdesk_service.asyncio.sleep",
+            AsyncMock(),
+        ):
+            result = asyncio.run(service.get_ticket(7))
+
+        self.assertTrue(result.is_success())
+        self.assertEqual(result.value, {"id": 7})
+        self.assertEqual(len(session.requests), 3)
+
+    def test_retries_stop_at_max_retries(self):
+        """Test that a request is sent at most max_retries + 1 times."""
+        service = _service(max_retries=2)
+        session = _FakeSession([_FakeResponse(429) for _ in range(5)])
+        service._session = session
+        with patch(
+            "customer_sentiment_hub.services.freshdesk_service.asyncio.sleep",
+            AsyncMock(),
+        ):
+            result = asyncio.run(service.get_ticket(7))
+
+        self.assertFalse(result.is_success())
+        self.assertEqual(len(session.requests), 3)
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """Test suite for the cache of analyses by cleaned review text."""
+
+    def _process(self, service, processor, ticket_id, description):
+        service.update_ticket_with_analysis = AsyncMock(return_value=Success({}))
+        asyncio.run(service.process_ticket_reviews(processor, ticket_id, description))
+        return service.update_ticket_with_analysis.await_args.args[2]
+
+    def test_repeated_text_reuses_analysis(self):
+        """Test that a second ticket with the same text skips the processor."""
+        service = _service()
+        processor = _FakeProcessor()
+        first = self._process(service, processor, 1, "<p>Great service</p>")
+        second = self._process(service, processor, 2, "<div><b>Great service</b></div>")
+        self.assertEqual(len(processor.calls), 1)
+        self.assertEqual(first["review_id"], "fd_1")
+        # The cached analysis is served under the new ticket's review ID
+        self.assertEqual(second["review_id"], "fd_2")
+        self.assertEqual(second["review_text"], "Great service")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache keeps at most analysis_cache_size entries."""
+        service = _service(analysis_cache_size=2)
+        service._store_cached_analysis("a", {"review_id": "a"})
+        service._store_cached_analysis("b", {"review_id": "b"})
+        # Reading "a" makes "b" the least recently used entry
+        self.assertEqual(service._get_cached_analysis("a"), {"review_id": "a"})
+        service._store_cached_analysis("c", {"review_id": "c"})
+        self.assertIsNone(service._get_cached_analysis("b"))
+        self.assertEqual(list(service._analysis_cache), ["a", "c"])
+
+    def test_zero_size_disables_cache(self):
+        """Test that analysis_cache_size=0 sends every ticket to the processor."""
+        service = _service(analysis_cache_size=0)
+        processor = _FakeProcessor()
+        self._process(service, processor, 1, "<p>Great service</p>")
+        self._process(service, processor, 2, "<p>Great service</p>")
+        self.assertEqual(len(processor.calls), 2)
+        self.assertEqual(len(service._analysis_cache), 0)
+
+    def test_failed_analysis_is_not_cached(self):
+        """Test that a placeholder review from a failed LLM batch is not reused."""
+        service = _service()
+        service._store_cached_analysis("a", {
+            "review_id": "fd_1", "labels": [], "processing_error": "vertex 503",
+        })
+        self.assertIsNone(service._get_cached_analysis("a"))
+        self.assertEqual(len(service._analysis_cache), 0)
+
+    def test_tickets_get_independent_copies(self):
+        """Test that tickets served from the cache do not share label lists."""
+        service = _service()
+        processor = _FakeProcessor(result=Success({"reviews": [
+            {"review_id": "fd_1", "labels": [{"category": "Product Features"}]},
+        ]}))
+        first = self._process(service, processor, 1, "<p>Great service</p>")
+        first["labels"].clear()
+        second = self._process(service, processor, 2, "<p>Great service</p>")
+        second["labels"].append({"category": "Other"})
+        third = self._process(service, processor, 3, "<p>Great service</p>")
+
+        self.assertEqual(len(processor.calls), 1)
+        self.assertEqual(third["labels"], [{"category": "Product Features"}])
+
+    def test_default_size_from_environment(self):
+        """Test that the environment factory falls back to the field default."""
+        self.assertEqual(_settings_from_clean_environment().analysis_cache_size, 1024)
+
+
+
+class TestTicketCache(unittest.TestCase):
+    """Test suite for the short-lived cache of fetched tickets."""
+
+    TICKET = {"id": 7, "description": "<p>Slow progress</p>"}
+
+    def _service(self, **overrides):
+        service = _service(**overrides)
+        service._send = AsyncMock(return_value=(200, b'{"id": 7, "description": "<p>Slow progress</p>"}'))
+        return service
+
+    def test_repeated_fetch_uses_cache(self):
+        """Test that a second fetch within the TTL skips the HTTP call."""
+        service = self._service(ticket_cache_ttl=60)
+        first = asyncio.run(service.get_ticket(7))
+        second = asyncio.run(service.get_ticket(7))
+        self.assertEqual(first.value, self.TICKET)
+        self.assertEqual(second.value, self.TICKET)
+        self.assertEqual(service._send.await_count, 1)
+
+    def test_expired_ticket_is_fetched_again(self):
+        """Test that an entry past its expiry is dropped and refetched."""
+        service = self._service(ticket_cache_ttl=60)
+        asyncio.run(service.get_ticket(7))
+        # Move the entry's expiry into the past
+        service._ticket_cache[7] = (time.monotonic() - 1, self.TICKET)
+        result = asyncio.run(service.get_ticket(7))
+        self.assertTrue(result.is_success())
+        self.assertEqual(service._send.await_count, 2)
+        self.assertGreater(service._ticket_cache[7][0], time.monotonic())
+
+    def test_failed_fetch_is_not_cached(self):
+        """Test that error responses are not kept."""
+        service = self._service(ticket_cache_ttl=60)
+        service._send = AsyncMock(return_value=(404, b"not found"))
+        result = asyncio.run(service.get_ticket(7))
+        self.assertFalse(result.is_success())
+        self.assertEqual(len(service._ticket_cache), 0)
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that ticket_cache_ttl=0 fetches every time."""
+        service = self._service(ticket_cache_ttl=0)
+        for _ in range(2):
+            self.assertEqual(asyncio.run(service.get_ticket(7)).value, self.TICKET)
+        self.assertEqual(service._send.await_count, 2)
+        self.assertEqual(len(service._ticket_cache), 0)
+
+    def test_default_ttl_from_environment(self):
+        """Test that the environment factory falls back to the field default."""
+        self.assertEqual(_settings_from_clean_environment().ticket_cache_ttl, 60)
+
+
+class TestReviewExtraction(unittest.TestCase):
+    """Test suite for pulling the review text out of ticket descriptions."""
+
+    def test_quoted_text_is_preferred(self):
+        """Test that span.quoted-text inside the request div is all that is kept."""
+        html = (
+            '<div id="ticket_original_request"><p>Hi team</p>'
+            '<span class="reply quoted-text">The <b>fees</b> were high</span>'
+            '<p>Sent from my phone</p></div>'
+        )
+        self.assertEqual(_extract_review_text(html), "The fees were high")
+
+    def test_empty_quoted_text_falls_back_to_request(self):
+        """Test that a blank quoted-text span does not hide the request text."""
+        html = (
+            '<div id="ticket_original_request">'
+            '<span class="quoted-text"> </span><p>Body text</p></div>'
+        )
+        self.assertEqual(_extract_review_text(html), "Body text")
+
+    def test_request_div_text(self):
+        """Test that only the first request div is kept, including void tags."""
+        html = (
+            '<html><body><div class="agent">Agent note</div>'
+            '<div id="ticket_original_request"><p>Slow <em>progress</em> on my<br>account</p>'
+            '<img src="a.png"><p>Thanks</p></div>'
+            '<div id="ticket_original_request"><p>Second copy</p></div></body></html>'
+        )
+        self.assertEqual(_extract_review_text(html), "Slow progress on my account Thanks")
+
+    def test_nested_tags_and_tails(self):
+        """Test that text and tails of nested elements keep document order."""
+        html = (
+            '<div id="ticket_original_request"><div><div><span>deep</span> text</div>'
+            ' tail</div> end</div><p>outside</p>'
+        )
+        self.assertEqual(_extract_review_text(html), "deep text tail end")
+
+    def test_script_and_style_are_stripped(self):
+        """Test that script and style contents never reach the review text."""
+        inside = (
+            '<div id="ticket_original_request"><script>var x = 1;</script>'
+            '<style>p {color: red}</style><p>Real text</p></div>'
+        )
+        self.assertEqual(_extract_review_text(inside), "Real text")
+        # Without a request div the whole document is used, minus scripts
+        outside = '<div><script>track()</script><p>Only <b>plain</b> markup</p></div>'
+        self.assertEqual(_extract_review_text(outside), "Only plain markup")
+
+    def test_plain_text_fallback(self):
+        """Test that descriptions without markup only have entities decoded."""
+        self.assertEqual(
+            _extract_review_text("Fees &amp; charges were too high  "),
+            "Fees & charges were too high",
+        )
+        self.assertEqual(_extract_review_text(""), "")
+
+    def test_parser_is_reset_between_documents(self):
+        """Test that state from one document does not leak into the next."""
+        first = '<div id="ticket_original_request"><span class="quoted-text">one</span></div>'
+        second = '<div id="ticket_original_request"><p>two</p></div><script>x</script>'
+        self.assertEqual(_extract_review_text(first), "one")
+        self.assertEqual(_extract_review_text(second), "two")
+
+
+
+class TestSmallDescriptionFastPath(unittest.TestCase):
+    """Test suite comparing the regex fast path with the lxml parser path."""
+
+    # Short descriptions without Freshdesk's request div take the fast path
+    CASES = (
+        "<p>I <3 this company, but fees > 10% hurt</p>",
+        "<p>Payment <$500> was late</p>",
+        "<p>5 >= 3</p>",
+        "<p>&gt; quoted reply</p>",
+        "<p>if x<y then</p>",
+        "<p>a <b and c> d</p>",
+        "<p>x</p>>",
+        "<<p>x</p>",
+        "<p>a</p><!-- note --><p>b</p>",
+        "&nbsp;<!-- note -->",
+        "<div><p>Slow&nbsp;progress</p><br/><p>on my <b>account</b></p></div>",
+        "<p>line1<br>line2</p>\n<p>  spaced   out </p>",
+        "<p>Tom &amp; Jerry &lt;b&gt;</p>",
+        "<P CLASS='x'>Upper</P>",
+        "<p>Hel<b>lo</b></p>",
+        "<ul><li>one</li><li>two</li></ul>",
+        "<a href='https://example.com/?a=1&b=2'>link</a> text",
+        "<p>café ✓</p>",
+    )
+
+    def test_matches_parser(self):
+        """Test that the fast path returns what the parser path would."""
+        for html in self.CASES:
+            with self.subTest(html=html):
+                self.assertEqual(_extract_review_text(html), _parse_review_text(html))
+
+    def test_literal_angle_brackets_are_kept(self):
+        """Test that text with a bare < or > is not mistaken for a tag."""
+        self.assertEqual(
+            _extract_review_text("<p>I <3 this company, but fees > 10% hurt</p>"),
+            "I <3 this company, but fees > 10% hurt",
+        )
+        self.assertEqual(
+            _extract_review_text("<p>Payment <$500> was late</p>"),
+            "Payment <$500> was late",
+        )
+
+
+class TestWebhookBatching(unittest.TestCase):
+    """Test suite for sharing processor calls between concurrent webhooks."""
+
+    def _analyze_all(self, service, processors, count):
+        """Run count concurrent analyses, spreading them over processors."""
+        async def run():
+            try:
+                return await asyncio.gather(
+                    *(
+                        service._analyze(processors[i % len(processors)], f"text {i}", f"fd_{i}")
+                        for i in range(count)
+                    ),
+                    return_exceptions=True,
+                )
+            finally:
+                await service.aclose()
+
+        return asyncio.run(run())
+
+    def test_reviews_within_window_share_one_call(self):
+        """Test that concurrent reviews are batched and results fanned out."""
+        service = _service(webhook_batch_size=8, webhook_batch_window_ms=50)
+        processor = _FakeProcessor()
+        results = self._analyze_all(service, [processor], 3)
+        self.assertEqual(processor.calls, [
+            (["text 0", "text 1", "text 2"], ["fd_0", "fd_1", "fd_2"]),
+        ])
+        for i, result in enumerate(results):
+            self.assertTrue(result.is_success())
+            self.assertEqual(
+                [review["review_id"] for review in result.value["reviews"]], [f"fd_{i}"]
+            )
+
+    def test_batch_size_caps_each_call(self):
+        """Test that a full batch is dispatched without waiting for the window."""
+        service = _service(webhook_batch_size=2, webhook_batch_window_ms=100)
+        processor = _FakeProcessor()
+        self._analyze_all(service, [processor], 5)
+        self.assertEqual([len(texts) for texts, _ in processor.calls], [2, 2, 1])
+
+    def test_each_processor_gets_its_own_call(self):
+        """Test that reviews for different processors are not mixed."""
+        service = _service(webhook_batch_size=8, webhook_batch_window_ms=50)
+        first, second = _FakeProcessor(), _FakeProcessor()
+        self._analyze_all(service, [first, second], 4)
+        self.assertEqual(first.calls, [(["text 0", "text 2"], ["fd_0", "fd_2"])])
+        self.assertEqual(second.calls, [(["text 1", "text 3"], ["fd_1", "fd_3"])])
+
+    def test_errors_reach_every_caller(self):
+        """Test that an Error result or an exception is given to each review."""
+        service = _service(webhook_batch_size=8, webhook_batch_window_ms=50)
+        failed = Error("quota exceeded")
+        results = self._analyze_all(service, [_FakeProcessor(result=failed)], 2)
+        self.assertEqual(results, [failed, failed])
+
+        boom = RuntimeError("boom")
+        results = self._analyze_all(service, [_FakeProcessor(result=boom)], 2)
+        self.assertEqual(results, [boom, boom])
+
+    def test_failed_processor_batch_gives_errors(self):
+        """Test that placeholder reviews for a failed LLM batch become Errors, not notes."""
+        service = _service(webhook_batch_size=8, webhook_batch_window_ms=50)
+        service.update_ticket_with_analysis = AsyncMock(return_value=Success({}))
+        llm = AsyncMock()
+        llm.analyze_reviews.return_value = Error("vertex 503")
+        # Seven reviews are more than one processor batch of five
+        processor = ReviewProcessor(llm, ProcessingSettings(batch_size=5, result_cache_size=0))
+
+        async def run():
+            try:
+                return await asyncio.gather(*(
+                    service.process_ticket_reviews(processor, i, f"<p>Review number {i}</p>")
+                    for i in range(7)
+                ))
+            finally:
+                await service.aclose()
+
+        results = asyncio.run(run())
+
+        self.assertEqual(llm.analyze_reviews.await_count, 2)
+        for result in results:
+            self.assertFalse(result.is_success())
+            self.assertIn("vertex 503", result.error)
+        service.update_ticket_with_analysis.assert_not_awaited()
+        self.assertEqual(len(service._analysis_cache), 0)
+
+    def test_missing_review_gives_empty_result(self):
+        """Test that a review dropped by the processor yields no reviews."""
+        service = _service(webhook_batch_size=8, webhook_batch_window_ms=50)
+        partial = Success({"reviews": [{"review_id": "fd_0", "labels": []}]})
+        results = self._analyze_all(service, [_FakeProcessor(result=partial)], 2)
+        self.assertEqual(results[0].value["reviews"], [{"review_id": "fd_0", "labels": []}])
+        self.assertEqual(results[1].value, {"reviews": []})
+
+    def test_shutdown_fails_pending_reviews(self):
+        """Test that aclose() resolves in-flight and queued reviews with an Error."""
+        service = _service(webhook_batch_size=2, webhook_batch_window_ms=10)
+        processor = _FakeProcessor(gate=asyncio.Event())
+
+        async def run():
+            tasks = [
+                asyncio.create_task(service._analyze(processor, f"text {i}", f"fd_{i}"))
+                for i in range(3)
+            ]
+            # Wait until the first batch is stuck in the processor
+            while not processor.calls:
+                await asyncio.sleep(0.001)
+            await service.aclose()
+            return await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+        results = asyncio.run(run())
+        self.assertEqual(len(processor.calls), 1)
+        for result in results:
+            self.assertFalse(result.is_success())
+            self.assertIn("shutting down", result.error)
+
+    def test_batching_disabled(self):
+        """Test that webhook_batch_size=1 calls the processor directly."""
+        service = _service(webhook_batch_size=1)
+        processor = _FakeProcessor()
+        self._analyze_all(service, [processor], 2)
+        self.assertEqual(len(processor.calls), 2)
+        self.assertIsNone(service._batch_worker)
+
+    def test_default_batching_from_environment(self):
+        """Test that the environment factory falls back to the field defaults."""
+        cfg = _settings_from_clean_environment()
+        self.assertEqual(cfg.webhook_batch_size, 8)
+        self.assertEqual(cfg.webhook_batch_window_ms, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
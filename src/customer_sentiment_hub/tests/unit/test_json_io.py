@@ -0,0 +1,133 @@
+"""
+Tests for JSON reading and writing.
+
+helpers uses orjson when it is installed and falls back to the standard
+json module otherwise; processor and freshdesk_service go through its
+json_loads/json_dumps. This module runs the same checks against both
+import branches.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from types import ModuleType
+from unittest.mock import patch
+
+from customer_sentiment_hub.services import freshdesk_service, processor
+from customer_sentiment_hub.utils import helpers
+
+_DATA = {"reviews": [{"review_id": "r1", "text": "Très bien ✓", "labels": [1, 2.5, None]}]}
+
+
+def _without_orjson(module: ModuleType) -> ModuleType:
+    """Load a separate copy of module as if orjson were not installed."""
+    spec = importlib.util.spec_from_file_location(f"{module.__name__}_stdlib_json", module.__file__)
+    copy = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"orjson": None}):
+        spec.loader.exec_module(copy)
+    return copy
+
+
+class TestJsonBackends(unittest.TestCase):
+    """Test suite for the orjson and stdlib json branches."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Load a stdlib-only copy of helpers."""
+        cls.stdlib_helpers = _without_orjson(helpers)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _variants(self):
+        """Yield (label, helpers module) for the orjson branch (if installed) and the stdlib one."""
+        self.assertFalse(hasattr(self.stdlib_helpers, "orjson"))
+        if hasattr(helpers, "orjson"):
+            yield "orjson", helpers
+        yield "json", self.stdlib_helpers
+
+    def _using(self, module, backend):
+        """Patch module to use backend's json_loads/json_dumps for the enclosed block."""
+        return patch.multiple(module, json_loads=backend.json_loads, json_dumps=backend.json_dumps)
+
+    def test_orjson_branch_is_used_when_installed(self):
+        """Test that the declared orjson dependency is picked up."""
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            self.skipTest("orjson is not installed")
+        self.assertTrue(hasattr(helpers, "orjson"))
+        self.assertIs(processor.json_dumps, helpers.json_dumps)
+        self.assertIs(freshdesk_service.json_loads, helpers.json_loads)
+
+    def test_dumps_options(self):
+        """Test that both branches write the same JSON for each option."""
+        data = {"b": 1, "a": "✓"}
+        for label, module in self._variants():
+            with self.subTest(backend=label):
+                self.assertEqual(json.loads(module.json_dumps(data)), data)
+                self.assertEqual(module.json_loads(module.json_dumps({3: None})), {"3": None})
+                self.assertEqual(module.json_dumps(data, indent=True, sort_keys=True).decode("utf-8"),
+                                 json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False))
+
+    def test_helpers_round_trip(self):
+        """Test save_json_file/load_json_file for small and memory-mapped files."""
+        large = {"reviews": [{"text": "x" * 100}] * 1000}  # over _MMAP_MIN_SIZE
+        for label, module in self._variants():
+            for data in (_DATA, large):
+                with self.subTest(backend=label, size=len(json.dumps(data))):
+                    path = os.path.join(self.tmp.name, label, "out.json")
+                    module.save_json_file(data, path)
+                    self.assertEqual(module.load_json_file(path), data)
+                    with open(path, encoding="utf-8") as f:
+                        self.assertEqual(json.load(f), data)
+
+    def test_helpers_output_matches_json_module(self):
+        """Test that both branches write what json.dumps would for indent=2."""
+        for label, module in self._variants():
+            with self.subTest(backend=label):
+                path = os.path.join(self.tmp.name, f"{label}.json")
+                module.save_json_file(_DATA, path)
+                with open(path, encoding="utf-8") as f:
+                    self.assertEqual(f.read(), json.dumps(_DATA, indent=2, ensure_ascii=False))
+
+    def test_helpers_invalid_json_raises_json_error(self):
+        """Test that both branches raise json.JSONDecodeError for bad input."""
+        path = os.path.join(self.tmp.name, "bad.json")
+        with open(path, "w") as f:
+            f.write("{not json")
+        for label, module in self._variants():
+            with self.subTest(backend=label):
+                with self.assertRaises(json.JSONDecodeError):
+                    module.load_json_file(path)
+
+    def test_processor_result_files(self):
+        """Test the indented and line-delimited result writers."""
+        reviews = _DATA["reviews"] * 3
+        for label, backend in self._variants():
+            with self.subTest(backend=label), self._using(processor, backend):
+                path = os.path.join(self.tmp.name, f"{label}.json")
+                processor._save_results(path, _DATA)
+                with open(path, encoding="utf-8") as f:
+                    self.assertEqual(json.load(f), _DATA)
+
+                lines_path = os.path.join(self.tmp.name, f"{label}.ndjson")
+                processor._write_ndjson(lines_path, reviews, "wb")
+                with open(lines_path, encoding="utf-8") as f:
+                    self.assertEqual([json.loads(line) for line in f], reviews)
+
+    def test_tojson_filter(self):
+        """Test that the tojson filter honours json.dumps's sort_keys and indent."""
+        for label, backend in self._variants():
+            with self.subTest(backend=label), self._using(freshdesk_service, backend):
+                ordered = freshdesk_service._tojson_dumps({"b": 1, "a": 2}, sort_keys=True)
+                self.assertEqual(list(json.loads(ordered)), ["a", "b"])
+                self.assertIn("\n  ", freshdesk_service._tojson_dumps(_DATA, indent=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
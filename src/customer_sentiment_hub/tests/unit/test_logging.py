@@ -0,0 +1,261 @@
+"""
+Tests for the logging module.
+
+This module contains tests for the queue-based logging setup: records are
+written by a listener thread into a log file under a temporary directory.
+"""
+
+import logging
+import tempfile
+import time
+import unittest
+from logging.handlers import QueueHandler
+from pathlib import Path
+from queue import SimpleQueue
+
+from customer_sentiment_hub.utils import logging as log_utils
+from customer_sentiment_hub.utils.logging import (
+    BufferedFileHandler,
+    CachedTimeFormatter,
+    _DrainingQueueListener,
+    configure_logging,
+)
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    """Poll predicate until it is true or timeout seconds have passed."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class _LoggingTestCase(unittest.TestCase):
+    """Base class that gives each test a log directory and restores logging after it."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.log_dir = Path(tmp.name)
+
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        saved_configured = log_utils._CONFIGURED
+
+        def restore():
+            log_utils._stop_listener()
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+            for handler in saved_handlers:
+                root.addHandler(handler)
+            root.setLevel(saved_level)
+            log_utils._CONFIGURED = saved_configured
+
+        self.addCleanup(restore)
+
+    def configure(self, name: str = "app.log", **options) -> Path:
+        """Configure file-only logging into the test directory and return the file."""
+        log_file = self.log_dir / name
+        options.setdefault("log_level", "INFO")
+        configure_logging(log_file=log_file, console_output=False, **options)
+        return log_file
+
+
+class TestQueueLogging(_LoggingTestCase):
+    """Test suite for configure_logging and the listener thread."""
+
+    def test_records_reach_the_file(self):
+        """Test that logged records are in the file once the listener stops."""
+        log_file = self.configure()
+        logging.getLogger("customer_sentiment_hub.test").info("hello %s", "world")
+        logging.getLogger("customer_sentiment_hub.test").debug("not at INFO")
+        log_utils._stop_listener()
+
+        contents = log_file.read_text(encoding="utf-8")
+        self.assertIn("Logging configured at level INFO", contents)
+        self.assertIn("customer_sentiment_hub.test - INFO - hello world", contents)
+        self.assertNotIn("not at INFO", contents)
+
+    def test_callers_only_enqueue(self):
+        """Test that the root logger hands records to a queue, not to the file."""
+        self.configure()
+
+        handlers = logging.getLogger().handlers
+        self.assertEqual(len(handlers), 1)
+        self.assertIsInstance(handlers[0], QueueHandler)
+        self.assertIsInstance(log_utils._listener, _DrainingQueueListener)
+
+    def test_creates_missing_log_directory(self):
+        """Test that the log file's directory is created."""
+        log_file = self.configure("nested/dir/app.log")
+        log_utils._stop_listener()
+
+        self.assertTrue(log_file.is_file())
+
+    def test_level_names(self):
+        """Test that level names are case-insensitive and unknown ones fall back to INFO."""
+        for name, level in (("debug", logging.DEBUG), ("WARN", logging.WARNING), ("Error", logging.ERROR)):
+            with self.subTest(name=name):
+                self.configure(log_level=name)
+                self.assertEqual(logging.getLogger().level, level)
+
+        log_file = self.configure("unknown.log", log_level="chatty")
+        log_utils._stop_listener()
+
+        self.assertEqual(logging.getLogger().level, logging.INFO)
+        contents = log_file.read_text(encoding="utf-8")
+        self.assertIn("Unknown log level 'chatty', using INFO", contents)
+        self.assertIn("Logging configured at level INFO", contents)
+
+    def test_leaves_record_attributes_switched_on(self):
+        """Test that configuring leaves the logging module's global flags alone."""
+        self.configure(log_format="%(message)s")
+
+        self.assertTrue(logging.logThreads)
+        self.assertTrue(logging.logProcesses)
+        self.assertTrue(logging.logMultiprocessing)
+        record = logging.makeLogRecord({"msg": "x"})
+        self.assertIsNotNone(record.thread)
+        self.assertIsNotNone(record.process)
+
+    def test_repeated_call_without_options_is_a_no_op(self):
+        """Test that configure_logging() keeps the configured handlers."""
+        log_file = self.configure()
+        listener = log_utils._listener
+        handlers = logging.getLogger().handlers[:]
+
+        configure_logging()
+        self.assertIs(log_utils._listener, listener)
+        self.assertEqual(logging.getLogger().handlers, handlers)
+
+        logging.getLogger("customer_sentiment_hub.test").info("after repeat")
+        log_utils._stop_listener()
+        contents = log_file.read_text(encoding="utf-8")
+        self.assertEqual(contents.count("Logging configured"), 1)
+        self.assertIn("after repeat", contents)
+
+    def test_reconfiguring_replaces_handlers(self):
+        """Test that explicit options swap in new handlers and close the old ones."""
+        first_file = self.configure("first.log")
+        logging.getLogger("customer_sentiment_hub.test").info("to first")
+        first_listener = log_utils._listener
+
+        second_file = self.configure("second.log", log_level="DEBUG")
+        self.assertIsNot(log_utils._listener, first_listener)
+        self.assertEqual(len(logging.getLogger().handlers), 1)
+        self.assertIsNone(first_listener.handlers[0].stream)
+
+        logging.getLogger("customer_sentiment_hub.test").debug("to second")
+        log_utils._stop_listener()
+        self.assertIn("to first", first_file.read_text(encoding="utf-8"))
+        second = second_file.read_text(encoding="utf-8")
+        self.assertIn("Logging configured at level DEBUG", second)
+        self.assertIn("to second", second)
+        self.assertNotIn("to first", second)
+
+    def test_listener_drains_when_queue_runs_dry(self):
+        """Test that buffered records are written once the queue is empty, without stopping."""
+        log_file = self.log_dir / "drained.log"
+        handler = BufferedFileHandler(log_file, buffer_size=1024 * 1024)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        queue: SimpleQueue = SimpleQueue()
+        listener = _DrainingQueueListener(queue, handler)
+        listener.start()
+        try:
+            logger = logging.Logger("drain-test")
+            logger.addHandler(QueueHandler(queue))
+            for i in range(3):
+                logger.warning("record %d", i)
+
+            self.assertTrue(_wait_for(
+                lambda: log_file.read_text(encoding="utf-8") == "record 0\nrecord 1\nrecord 2\n"
+            ))
+        finally:
+            listener.stop()
+            handler.close()
+
+
+class TestCachedTimeFormatter(unittest.TestCase):
+    """Test suite for CachedTimeFormatter."""
+
+    def test_without_msec_format(self):
+        """Test that default_msec_format = None leaves out milliseconds, as in logging.Formatter."""
+        cached = CachedTimeFormatter("%(asctime)s")
+        standard = logging.Formatter("%(asctime)s")
+        cached.default_msec_format = standard.default_msec_format = None
+        record = logging.makeLogRecord({"msg": "x", "created": 1700000000.5, "msecs": 500.0})
+
+        self.assertEqual(cached.format(record), standard.format(record))
+
+    def test_matches_standard_formatter(self):
+        """Test that cached timestamps format exactly like logging.Formatter."""
+        for datefmt in (None, "%d/%m %H:%M:%S"):
+            cached = CachedTimeFormatter("%(asctime)s %(message)s", datefmt)
+            standard = logging.Formatter("%(asctime)s %(message)s", datefmt)
+            for created in (1700000000.0, 1700000000.25, 1700000000.999, 1700000001.5):
+                record = logging.makeLogRecord({"msg": "x", "created": created})
+                record.msecs = (created - int(created)) * 1000
+                with self.subTest(datefmt=datefmt, created=created):
+                    self.assertEqual(cached.format(record), standard.format(record))
+
+
+class TestBufferedFileHandler(unittest.TestCase):
+    """Test suite for BufferedFileHandler."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.log_file = Path(tmp.name) / "buffered.log"
+
+    def _handler(self, **options) -> BufferedFileHandler:
+        handler = BufferedFileHandler(self.log_file, **options)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.addCleanup(handler.close)
+        return handler
+
+    @staticmethod
+    def _record(message: str) -> logging.LogRecord:
+        return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+    def test_records_wait_for_drain(self):
+        """Test that emitted records stay in the buffer until drain()."""
+        handler = self._handler()
+        handler.emit(self._record("first"))
+        handler.flush()
+        self.assertEqual(self.log_file.read_text(encoding="utf-8"), "")
+
+        handler.drain()
+        self.assertEqual(self.log_file.read_text(encoding="utf-8"), "first\n")
+
+    def test_close_writes_buffered_records(self):
+        """Test that closing the handler writes what is still buffered."""
+        handler = self._handler()
+        handler.emit(self._record("first"))
+        handler.emit(self._record("second"))
+        handler.close()
+
+        self.assertEqual(self.log_file.read_text(encoding="utf-8"), "first\nsecond\n")
+
+    def test_full_buffer_is_written(self):
+        """Test that records reach the file without drain() once they overflow the buffer."""
+        message = "x" * (16 * 1024)
+        handler = self._handler(buffer_size=1024)
+        handler.emit(self._record(message))
+
+        self.assertEqual(self.log_file.read_text(encoding="utf-8"), message + "\n")
+
+    def test_delay_opens_file_on_first_record(self):
+        """Test that delay=True creates the file only when a record is emitted."""
+        handler = self._handler(delay=True)
+        handler.drain()
+        self.assertFalse(self.log_file.exists())
+
+        handler.emit(self._record("first"))
+        handler.drain()
+        self.assertEqual(self.log_file.read_text(encoding="utf-8"), "first\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,342 @@
+"""
+Tests for the review processor.
+
+This module contains tests for how ReviewProcessor de-duplicates, caches
+and batches reviews for the LLM, run against fake LLM services.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from customer_sentiment_hub.config.settings import ProcessingSettings
+from customer_sentiment_hub.services.processor import ReviewProcessor, _fan_out_reviews
+from customer_sentiment_hub.utils.result import Error, Success
+
+
+class _FakeLLM:
+    """
+    LLM service stand-in that labels every text and records its calls.
+
+    counts, if given, is how many reviews each successive call returns,
+    to mimic an LLM that drops or invents reviews.
+    """
+
+    def __init__(self, counts=None) -> None:
+        self.calls = []
+        self.counts = list(counts or [])
+
+    async def analyze_reviews(self, review_texts):
+        self.calls.append(list(review_texts))
+        if self.counts:
+            count = self.counts.pop(0)
+            review_texts = (list(review_texts) * count)[:count]
+        return Success({
+            "reviews": [
+                {
+                    "review_id": str(1000 + i),
+                    "text": text,
+                    "labels": [{
+                        "category": "Product Features",
+                        "subcategory": "App Performance",
+                        "sentiment": "Positive",
+                    }],
+                }
+                for i, text in enumerate(review_texts)
+            ]
+        })
+
+
+class _StallingLLM:
+    """LLM service stand-in that soon fails "bad" texts and never answers the rest."""
+
+    def __init__(self) -> None:
+        self.started = []
+        self.cancelled = []
+
+    async def analyze_reviews(self, review_texts):
+        self.started.append(review_texts[0])
+        if review_texts[0] == "bad":
+            await asyncio.sleep(0.01)
+            return Error("quota exceeded")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(review_texts[0])
+            raise
+
+
+def _processor(llm, **overrides) -> ReviewProcessor:
+    """Build a processor around llm with the given settings."""
+    return ReviewProcessor(llm, ProcessingSettings(**overrides))
+
+
+class TestDeduplication(unittest.TestCase):
+    """Test suite for sending each distinct text to the LLM once."""
+
+    def test_case_only_duplicates_are_sent_once(self):
+        """Test that texts differing only in case share one analysis."""
+        llm = _FakeLLM()
+        processor = _processor(llm, result_cache_size=0)
+        texts = ["Great app", "GREAT APP", "Slow checkout", "great App"]
+
+        result = asyncio.run(processor.process_reviews(texts, ["a", "b", "c", "d"]))
+
+        self.assertTrue(result.is_success())
+        self.assertEqual(llm.calls, [["Great app", "Slow checkout"]])
+        reviews = result.value["reviews"]
+        self.assertEqual([r["review_id"] for r in reviews], ["a", "b", "c", "d"])
+        self.assertEqual([r["text"] for r in reviews], texts)
+        self.assertEqual(reviews[0]["labels"], reviews[1]["labels"])
+
+    def test_duplicates_get_independent_copies(self):
+        """Test that changing one fanned-out review leaves its duplicates alone."""
+        processor = _processor(_FakeLLM(), result_cache_size=0)
+
+        result = asyncio.run(processor.process_reviews(["Nice", "NICE"], ["a", "b"]))
+
+        first, second = result.value["reviews"]
+        first["labels"][0]["sentiment"] = "Negative"
+        self.assertEqual(second["labels"][0]["sentiment"], "Positive")
+
+    def test_distinct_texts_keep_their_order(self):
+        """Test that reviews without duplicates come back as given."""
+        llm = _FakeLLM()
+        processor = _processor(llm, result_cache_size=0)
+
+        result = asyncio.run(processor.process_reviews(["one", "two", "three"]))
+
+        self.assertEqual(llm.calls, [["one", "two", "three"]])
+        self.assertEqual(
+            [r["review_id"] for r in result.value["reviews"]], ["1000", "1001", "1002"]
+        )
+
+
+class TestReviewCache(unittest.TestCase):
+    """Test suite for reusing analyses across requests."""
+
+    def test_hit_skips_the_llm(self):
+        """Test that a text seen before, in any case, is not sent again."""
+        llm = _FakeLLM()
+        processor = _processor(llm)
+        asyncio.run(processor.process_reviews(["Great app", "Slow"], ["a", "b"]))
+
+        result = asyncio.run(processor.process_reviews(["GREAT APP", "New one"], ["c", "d"]))
+
+        self.assertEqual(llm.calls, [["Great app", "Slow"], ["New one"]])
+        reviews = result.value["reviews"]
+        self.assertEqual([r["review_id"] for r in reviews], ["c", "d"])
+        self.assertEqual(reviews[0]["text"], "GREAT APP")
+
+    def test_hits_are_private_copies(self):
+        """Test that changing a returned review does not change the cache."""
+        llm = _FakeLLM()
+        processor = _processor(llm)
+        first = asyncio.run(processor.process_reviews(["Great app"], ["a"]))
+        first.value["reviews"][0]["labels"].clear()
+
+        second = asyncio.run(processor.process_reviews(["Great app", "x y"], ["b", "c"]))
+
+        self.assertEqual(len(llm.calls), 2)
+        self.assertEqual(len(second.value["reviews"][0]["labels"]), 1)
+
+    def test_size_zero_disables_cache(self):
+        """Test that result_cache_size=0 sends every request to the LLM."""
+        llm = _FakeLLM()
+        processor = _processor(llm, result_cache_size=0)
+        for _ in range(2):
+            asyncio.run(processor.process_reviews(["Great app"]))
+
+        self.assertEqual(len(llm.calls), 2)
+        self.assertEqual(len(processor._review_cache), 0)
+
+    def test_short_output_is_not_cached(self):
+        """Test that nothing is cached when the LLM returns fewer reviews than texts."""
+        llm = _FakeLLM(counts=[1])
+        processor = _processor(llm)
+
+        result = asyncio.run(processor.process_reviews(["one", "two"], ["a", "b"]))
+
+        self.assertEqual([r["review_id"] for r in result.value["reviews"]], ["a"])
+        self.assertEqual(len(processor._review_cache), 0)
+
+    def test_misaligned_batches_are_not_cached(self):
+        """Test that a batch short one review and another with one extra are not cached."""
+        llm = _FakeLLM(counts=[1, 3])
+        processor = _processor(llm, batch_size=2, max_concurrent_batches=1)
+
+        result = asyncio.run(
+            processor.process_reviews(["one", "two", "three", "four"], ["a", "b", "c", "d"])
+        )
+
+        self.assertEqual(len(result.value["reviews"]), 4)
+        self.assertEqual(len(processor._review_cache), 0)
+
+    def test_misaligned_misses_are_not_cached(self):
+        """Test that the alignment check also covers requests with cache hits."""
+        llm = _FakeLLM(counts=[1, 1])
+        processor = _processor(llm)
+        asyncio.run(processor.process_reviews(["one"], ["a"]))
+
+        asyncio.run(processor.process_reviews(["one", "two", "three"], ["a", "b", "c"]))
+
+        self.assertEqual(llm.calls[1], ["two", "three"])
+        self.assertEqual(len(processor._review_cache), 1)
+
+    def test_failed_batches_are_not_cached(self):
+        """Test that placeholder reviews for a failed batch are not reused."""
+        llm = _FakeLLM()
+        processor = _processor(llm, batch_size=1)
+        with patch.object(llm, "analyze_reviews", AsyncMock(return_value=Error("quota"))):
+            result = asyncio.run(processor.process_reviews(["one", "two"]))
+
+        self.assertIn("processing_error", result.value["reviews"][0])
+        self.assertEqual(len(processor._review_cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache keeps only result_cache_size texts."""
+        llm = _FakeLLM()
+        processor = _processor(llm, result_cache_size=2)
+        for text in ["one", "two", "one", "three"]:
+            asyncio.run(processor.process_reviews([text]))
+
+        asyncio.run(processor.process_reviews(["one", "two"]))
+
+        self.assertEqual(llm.calls, [["one"], ["two"], ["three"], ["two"]])
+
+
+class TestFailFast(unittest.TestCase):
+    """Test suite for stopping a run at the first failed batch."""
+
+    def test_first_error_cancels_in_flight_batches(self):
+        """Test that a failed batch cancels running batches and skips queued ones."""
+        llm = _StallingLLM()
+        processor = _processor(
+            llm, batch_size=1, max_concurrent_batches=3, fail_fast=True,
+            result_cache_size=0,
+        )
+        texts = ["slow one", "bad", "slow two", "queued one", "queued two"]
+
+        async def run():
+            result = await processor.process_reviews(texts)
+            await asyncio.sleep(0)  # let the cancellations land
+            return result
+
+        result = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+        self.assertFalse(result.is_success())
+        self.assertEqual(result.error, "Stopped after a failed batch: batch 2: quota exceeded")
+        self.assertEqual(llm.started, ["slow one", "bad", "slow two"])
+        self.assertEqual(sorted(llm.cancelled), ["slow one", "slow two"])
+
+    def test_without_fail_fast_failures_become_placeholders(self):
+        """Test that the default mode keeps going and marks the failed batch."""
+        llm = _FakeLLM()
+        processor = _processor(llm, batch_size=1, result_cache_size=0)
+        answer = llm.analyze_reviews
+
+        async def fail_first(review_texts):
+            if not llm.calls:
+                llm.calls.append(list(review_texts))
+                return Error("quota exceeded")
+            return await answer(review_texts)
+
+        with patch.object(llm, "analyze_reviews", fail_first):
+            result = asyncio.run(processor.process_reviews(["one", "two", "three"]))
+
+        reviews = result.value["reviews"]
+        self.assertEqual([r["review_id"] for r in reviews], ["1000", "1001", "1002"])
+        self.assertIn("quota exceeded", reviews[0]["processing_error"])
+        self.assertNotIn("processing_error", reviews[1])
+        self.assertEqual(len(llm.calls), 3)
+
+
+class TestAdaptiveBatchSize(unittest.TestCase):
+    """Test suite for tuning the batch size between runs."""
+
+    def _processor(self, **overrides) -> ReviewProcessor:
+        options = {
+            "batch_size": 4, "adaptive_batch_size": True, "max_batch_size": 9,
+            "target_batch_latency": 1.0,
+        }
+        options.update(overrides)
+        return _processor(_FakeLLM(), **options)
+
+    def test_fast_batches_grow_up_to_max(self):
+        """Test that quick batches grow the size but never past max_batch_size."""
+        processor = self._processor()
+        sizes = []
+        for _ in range(10):
+            processor._adapt_batch_size([0.1], failed=0)
+            sizes.append(processor.batch_size)
+
+        self.assertEqual(sizes[:3], [5, 6, 7])
+        self.assertEqual(sizes[-1], 9)
+        self.assertLessEqual(max(sizes), 9)
+
+    def test_failures_shrink_down_to_one(self):
+        """Test that failed batches halve the size but never below one."""
+        processor = self._processor()
+        sizes = []
+        for _ in range(5):
+            processor._adapt_batch_size([], failed=1)
+            sizes.append(processor.batch_size)
+
+        self.assertEqual(sizes, [2, 1, 1, 1, 1])
+
+    def test_slow_batches_shrink_and_in_range_batches_keep_size(self):
+        """Test that latency above twice the target halves the size and in-between keeps it."""
+        processor = self._processor(batch_size=8)
+        processor._adapt_batch_size([1.5], failed=0)
+        self.assertEqual(processor.batch_size, 8)
+
+        processor._adapt_batch_size([10.0], failed=0)
+        self.assertEqual(processor.batch_size, 4)
+
+    def test_runs_tune_the_next_run(self):
+        """Test that a batched run feeds its latencies into the batch size."""
+        processor = self._processor()
+        texts = [f"review {i}" for i in range(12)]
+        asyncio.run(processor.process_reviews(texts))
+        self.assertEqual(processor.batch_size, 5)
+
+    def test_disabled_keeps_configured_size(self):
+        """Test that without adaptive_batch_size runs leave the size alone."""
+        processor = self._processor(adaptive_batch_size=False)
+        asyncio.run(processor.process_reviews([f"review {i}" for i in range(12)]))
+
+        self.assertEqual(processor.batch_size, 4)
+
+
+class TestFanOutReviews(unittest.TestCase):
+    """Test suite for _fan_out_reviews."""
+
+    def test_fans_out_in_input_order(self):
+        """Test that every input gets its distinct text's review, IDs and text restored."""
+        unique = [
+            {"review_id": "1000", "text": "Great app", "labels": ["x"]},
+            {"review_id": "1001", "text": "Slow", "labels": ["y"]},
+        ]
+
+        reviews = _fan_out_reviews(
+            unique, [0, 1, 0], ["a", "b", "c"], ["Great app", "Slow", "GREAT APP"]
+        )
+
+        self.assertEqual([r["review_id"] for r in reviews], ["a", "b", "c"])
+        self.assertEqual([r["text"] for r in reviews], ["Great app", "Slow", "GREAT APP"])
+        self.assertIs(reviews[0], unique[0])
+        self.assertIsNot(reviews[2], unique[0])
+        self.assertIsNot(reviews[2]["labels"], unique[0]["labels"])
+
+    def test_skips_missing_reviews(self):
+        """Test that inputs whose distinct text got no review are left out."""
+        unique = [{"review_id": "1000", "labels": []}, None]
+
+        reviews = _fan_out_reviews(unique, [0, 1, 1], ["a", "b", "c"], ["x", "y", "Y"])
+
+        self.assertEqual([r["review_id"] for r in reviews], ["a"])
+        self.assertNotIn("text", reviews[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
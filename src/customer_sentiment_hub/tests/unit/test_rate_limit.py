@@ -0,0 +1,51 @@
+"""
+Tests for the rate limit module.
+
+This module contains tests for the asyncio token bucket used to pace
+requests to the LLM provider.
+"""
+
+import asyncio
+import time
+import unittest
+
+from customer_sentiment_hub.utils.rate_limit import AsyncTokenBucket
+
+
+class TestAsyncTokenBucket(unittest.TestCase):
+    """Test suite for AsyncTokenBucket."""
+
+    def test_rejects_non_positive_capacity(self):
+        """Test that a bucket needs a positive capacity and period."""
+        with self.assertRaises(ValueError):
+            AsyncTokenBucket(0)
+        with self.assertRaises(ValueError):
+            AsyncTokenBucket(10, period=0)
+
+    def test_burst_up_to_capacity_then_waits(self):
+        """Test that a full bucket allows a burst and then paces callers."""
+        async def run():
+            bucket = AsyncTokenBucket(5, period=0.1)  # 50 tokens per second
+            start = time.monotonic()
+            for _ in range(5):
+                await bucket.acquire()
+            burst = time.monotonic() - start
+            await bucket.acquire(2)
+            return burst, time.monotonic() - start
+
+        burst, total = asyncio.run(run())
+        self.assertLess(burst, 0.02)
+        self.assertGreaterEqual(total, 0.035)
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        """Test that asking for more than the capacity does not block forever."""
+        async def run():
+            bucket = AsyncTokenBucket(3, period=0.05)
+            await bucket.acquire(100)
+            return bucket._tokens
+
+        self.assertEqual(asyncio.run(run()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Tests for the result module.
+
+This module contains tests for the Result, Success and Error types.
+"""
+
+import copy
+import pickle
+import unittest
+
+from customer_sentiment_hub.utils.result import (
+    Error,
+    Result,
+    Success,
+    _pooled_error,
+    collect_results,
+)
+
+
+class TestAndThen(unittest.TestCase):
+    """Test suite for Result.and_then."""
+
+    def test_success_to_success(self):
+        """Test that a function returning Success gives that Success, unwrapped once."""
+        result = Success(2).and_then(lambda value: Success(value * 10))
+
+        self.assertIsInstance(result, Success)
+        self.assertEqual(result.value, 20)
+
+    def test_success_to_error(self):
+        """Test that a function returning Error gives that same Error."""
+        failure = Error("too small")
+
+        result = Success(2).and_then(lambda value: failure)
+
+        self.assertIs(result, failure)
+
+    def test_plain_return_is_wrapped(self):
+        """Test that a function returning a non-Result value is wrapped in Success."""
+        for value in (20, None, [1, 2], {"a": 1}):
+            with self.subTest(value=value):
+                result = Success(2).and_then(lambda _: value)
+                self.assertIsInstance(result, Success)
+                self.assertEqual(result.value, value)
+
+    def test_error_passes_through_without_calling(self):
+        """Test that an Error is returned as is and the function is never called."""
+        calls = []
+        error = Error("failed")
+
+        result = error.and_then(lambda value: calls.append(value) or Success(value))
+
+        self.assertIs(result, error)
+        self.assertEqual(calls, [])
+
+    def test_chains_stop_at_first_error(self):
+        """Test that a chain runs until its first Error and then skips the rest."""
+        calls = []
+
+        def step(name, outcome):
+            def fn(value):
+                calls.append(name)
+                return outcome(value)
+            return fn
+
+        result = (
+            Success(1)
+            .and_then(step("double", lambda v: v * 2))
+            .and_then(step("fail", lambda v: Error(f"bad {v}")))
+            .and_then(step("never", lambda v: Success(v)))
+        )
+
+        self.assertEqual(result.error, "bad 2")
+        self.assertEqual(calls, ["double", "fail"])
+
+
+class TestCollectResults(unittest.TestCase):
+    """Test suite for collect_results."""
+
+    def test_all_successes_are_collected_in_order(self):
+        """Test that the values of all successes are returned as one list."""
+        result = collect_results([Success(1), Success(None), Success("x")])
+
+        self.assertTrue(result.is_success())
+        self.assertEqual(result.value, [1, None, "x"])
+
+    def test_first_error_is_returned(self):
+        """Test that the first Error is returned as is."""
+        first = Error("first")
+
+        self.assertIs(collect_results([Success(1), first, Error("second")]), first)
+
+    def test_empty_list(self):
+        """Test that no results collect to an empty success."""
+        self.assertEqual(collect_results([]).value, [])
+
+
+class TestErrorPool(unittest.TestCase):
+    """Test suite for the Errors shared by Result.error and Result.from_exception."""
+
+    def setUp(self):
+        _pooled_error.cache_clear()
+        self.addCleanup(_pooled_error.cache_clear)
+
+    def test_same_message_shares_an_instance(self):
+        """Test that repeated messages return the same Error."""
+        first = Result.error("quota exceeded")
+
+        self.assertIs(Result.error("quota exceeded"), first)
+        self.assertIs(Result.from_exception(ValueError("quota exceeded")), first)
+        self.assertIsNot(Result.error("other"), first)
+
+    def test_pool_keeps_recently_used_messages(self):
+        """Test that the pool is bounded and evicts the least recently used message."""
+        maxsize = _pooled_error.cache_info().maxsize
+        kept = Result.error("kept")
+        evicted = Result.error("evicted")
+        for i in range(maxsize - 1):
+            Result.error(f"message {i}")
+            Result.error("kept")
+
+        self.assertEqual(_pooled_error.cache_info().currsize, maxsize)
+        self.assertIs(Result.error("kept"), kept)
+        self.assertIsNot(Result.error("evicted"), evicted)
+
+    def test_errors_are_immutable(self):
+        """Test that a shared Error cannot be changed by one of its holders."""
+        error = Result.error("quota exceeded")
+
+        with self.assertRaises(AttributeError):
+            error.error = "changed"
+        with self.assertRaises(AttributeError):
+            del error.error
+        with self.assertRaises(AttributeError):
+            error.extra = "x"
+        self.assertEqual(Result.error("quota exceeded").error, "quota exceeded")
+
+    def test_errors_copy_and_pickle(self):
+        """Test that immutable errors still copy and pickle."""
+        error = Error("quota exceeded")
+
+        for clone in (copy.copy(error), copy.deepcopy(error), pickle.loads(pickle.dumps(error))):
+            self.assertIsInstance(clone, Error)
+            self.assertEqual(clone.error, "quota exceeded")
+
+
+class TestSuccessSharing(unittest.TestCase):
+    """Test suite for the shared Success returned by Result.success(None)."""
+
+    def test_unit_success_is_shared_and_immutable(self):
+        """Test that Result.success(None) is shared and cannot be changed by a holder."""
+        unit = Result.success(None)
+
+        self.assertIs(Result.success(None), unit)
+        with self.assertRaises(AttributeError):
+            unit.value = "changed"
+        with self.assertRaises(AttributeError):
+            del unit.value
+        self.assertIsNone(Result.success(None).value)
+
+    def test_successes_copy_and_pickle(self):
+        """Test that immutable successes still copy and pickle, deep copies included."""
+        success = Success({"reviews": [1]})
+
+        for clone in (copy.deepcopy(success), pickle.loads(pickle.dumps(success))):
+            self.assertIsInstance(clone, Success)
+            self.assertEqual(clone.value, {"reviews": [1]})
+            self.assertIsNot(clone.value, success.value)
+        self.assertIs(copy.copy(success).value, success.value)
+
+    def test_success_is_not_pooled(self):
+        """Test that successes with equal values are separate objects."""
+        self.assertIsNot(Result.success([1]), Result.success([1]))
+        self.assertIsInstance(Result.success([1]), Success)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Tests for the secret manager module.
+
+This module contains tests for how Gemini credentials are written to and
+reused from disk, run against a temporary directory instead of /tmp.
+"""
+
+import json
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from customer_sentiment_hub.utils.secret_manager import _write_credentials_file
+
+_CREDS = {"type": "service_account", "project_id": "demo", "private_key": "k"}
+
+
+def _mode(path) -> int:
+    """Permission bits of path itself, not of a symlink's target."""
+    return stat.S_IMODE(os.lstat(path).st_mode)
+
+
+class TestCredentialsFile(unittest.TestCase):
+    """Test suite for _write_credentials_file."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = patch.object(tempfile, "tempdir", tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.private_dir = Path(tmp.name) / f"customer_sentiment_hub-{os.getuid()}"
+
+    def write(self, creds=_CREDS) -> Path:
+        """Write creds for a fixed secret and return the file's path."""
+        return Path(_write_credentials_file("secret", "us-west-1", creds))
+
+    def test_writes_into_private_directory(self):
+        """Test that the file and its directory are only accessible to this user."""
+        path = self.write()
+
+        self.assertEqual(path.parent, self.private_dir)
+        self.assertEqual(_mode(self.private_dir), 0o700)
+        self.assertEqual(_mode(path), 0o600)
+        self.assertEqual(json.loads(path.read_bytes()), _CREDS)
+        self.assertEqual([p.name for p in self.private_dir.iterdir()], [path.name])
+
+    def test_identical_file_is_reused(self):
+        """Test that a second write of the same credentials keeps the existing file."""
+        first = self.write()
+        inode = first.stat().st_ino
+
+        second = self.write()
+
+        self.assertEqual(second, first)
+        self.assertEqual(second.stat().st_ino, inode)
+
+    def test_changed_credentials_are_rewritten(self):
+        """Test that different credentials replace the file."""
+        path = self.write()
+
+        self.assertEqual(self.write({**_CREDS, "private_key": "new"}), path)
+        self.assertEqual(json.loads(path.read_bytes())["private_key"], "new")
+
+    def test_readable_file_is_not_reused(self):
+        """Test that a matching file others can read is replaced by a private one."""
+        path = self.write()
+        path.chmod(0o644)
+
+        self.assertEqual(self.write(), path)
+        self.assertEqual(_mode(path), 0o600)
+
+    def test_symlinked_file_is_not_followed(self):
+        """Test that a symlink in place of the file is replaced, not read or written through."""
+        path = self.write()
+        target = Path(tempfile.gettempdir()) / "elsewhere.json"
+        target.write_bytes(path.read_bytes())
+        path.unlink()
+        path.symlink_to(target)
+
+        self.assertEqual(self.write({**_CREDS, "private_key": "new"}), path)
+        self.assertFalse(path.is_symlink())
+        self.assertEqual(json.loads(target.read_bytes())["private_key"], "k")
+
+    def test_open_directory_is_not_used(self):
+        """Test that a directory others can enter is passed over for a fresh private one."""
+        self.private_dir.mkdir(mode=0o755)
+        self.private_dir.chmod(0o755)
+
+        path = self.write()
+
+        self.assertNotEqual(path.parent, self.private_dir)
+        self.assertEqual(_mode(path.parent), 0o700)
+        self.assertEqual(list(self.private_dir.iterdir()), [])
+
+    def test_symlinked_directory_is_not_used(self):
+        """Test that a symlink at the directory's name is not followed."""
+        target = Path(tempfile.gettempdir()) / "planted"
+        target.mkdir(mode=0o700)
+        self.private_dir.symlink_to(target)
+
+        path = self.write()
+
+        self.assertNotEqual(path.parent, self.private_dir)
+        self.assertEqual(list(target.iterdir()), [])
+
+    def test_directory_of_another_user_is_not_used(self):
+        """Test that a directory owned by someone else is passed over."""
+        other_uid = os.getuid() + 1
+        planted = Path(tempfile.gettempdir()) / f"customer_sentiment_hub-{other_uid}"
+        planted.mkdir(mode=0o700)
+
+        with patch("os.getuid", return_value=other_uid):
+            path = self.write()
+
+        self.assertNotEqual(path.parent, planted)
+        self.assertEqual(list(planted.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,9 +10,11 @@ from customer_sentiment_hub.domain.taxonomy import (
     Sentiment, CategoryType, TAXONOMY,
     get_valid_categories, get_valid_subcategories,
     get_category_for_subcategory, is_valid_subcategory_for_category,
-    generate_taxonomy_string
+    get_default_subcategory, generate_taxonomy_string
 )
 
+_EXPECTED_SENTIMENTS = frozenset({"Positive", "Negative", "Neutral"})
+
 
 class TestTaxonomy(unittest.TestCase):
     """Test suite for the taxonomy module."""
@@ -41,7 +43,7 @@ class TestTaxonomy(unittest.TestCase):
         self.assertIn("Categories", TAXONOMY)
         
         # Test sentiments
-        self.assertEqual(TAXONOMY["Sentiments"], frozenset(s.value for s in Sentiment))
+        self.assertEqual(TAXONOMY["Sentiments"], _EXPECTED_SENTIMENTS)
         
         # Test categories
         categories = TAXONOMY["Categories"]
@@ -149,6 +151,28 @@ class TestTaxonomy(unittest.TestCase):
             CategoryType.PRODUCT_SERVICES.value, "NonExistentSubcategory"
         ))
 
+    def test_get_default_subcategory(self):
+        """Test the get_default_subcategory function."""
+        # Defaults are valid for their (category, sentiment) pair
+        for category, sentiment_subcats in TAXONOMY["Categories"].items():
+            for sentiment, subcategories in sentiment_subcats.items():
+                self.assertIn(get_default_subcategory(category, sentiment), subcategories)
+
+        # Defaults are deterministic
+        self.assertEqual(
+            get_default_subcategory(CategoryType.PRODUCT_SERVICES.value, "Negative"),
+            min(TAXONOMY["Categories"][CategoryType.PRODUCT_SERVICES.value]["Negative"])
+        )
+
+        # Unknown sentiment falls back to any subcategory of the category
+        self.assertIn(
+            get_default_subcategory(CategoryType.COMMUNICATION.value, "Unknown"),
+            get_valid_subcategories()[CategoryType.COMMUNICATION.value]
+        )
+
+        # Unknown category falls back to "Other"
+        self.assertEqual(get_default_subcategory("NonExistentCategory", "Negative"), "Other")
+
     def test_generate_taxonomy_string(self):
         """Test the generate_taxonomy_string function."""
         taxonomy_string = generate_taxonomy_string()
@@ -9,13 +9,22 @@ import unittest
 from customer_sentiment_hub.domain.taxonomy import Sentiment, CategoryType
 from customer_sentiment_hub.domain.validation import ValidationService
 
+# Product & Services subcategories valid with a Negative sentiment
+_PS_NEGATIVE_SUBCATEGORIES = frozenset({
+    "Unsettled Debt", "Progress Pace", "Procedure", "Settlement Percentage",
+    "Creditor Correspondence", "Debt Priority", "Settlement Failure",
+    "Summons", "Legal Procedure", "Legal Plan Representation",
+    "Lending", "Unmet Expectations (Services)", "Delayed Cancellation Requests",
+})
+
 
 class TestValidationService(unittest.TestCase):
     """Test suite for the ValidationService."""
 
-    def setUp(self):
-        """Set up a fresh ValidationService for each test."""
-        self.service = ValidationService()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one ValidationService shared by all tests (it is stateless)."""
+        cls.service = ValidationService()
 
     def test_clean_sentiment(self):
         """Test cleaning and standardizing sentiment values."""
@@ -37,7 +46,11 @@ class TestValidationService(unittest.TestCase):
         self.assertEqual(self.service.clean_sentiment("good"), "Positive")
         self.assertEqual(self.service.clean_sentiment("bad"), "Negative")
         self.assertEqual(self.service.clean_sentiment("mixed"), "Neutral")
-        
+
+        # Surrounding punctuation and whitespace should be ignored
+        self.assertEqual(self.service.clean_sentiment(" Pos. "), "Positive")
+        self.assertEqual(self.service.clean_sentiment("'bad'"), "Negative")
+
         # Containing valid sentiment should normalize
         self.assertEqual(self.service.clean_sentiment("very positive"), "Positive")
         self.assertEqual(self.service.clean_sentiment("somewhat negative"), "Negative")
@@ -60,6 +73,8 @@ class TestValidationService(unittest.TestCase):
         }
         fixed_label = self.service.validate_and_fix_label(valid_label)
         self.assertEqual(fixed_label, valid_label)
+        # Nothing to fix, so no copy is made
+        self.assertIs(fixed_label, valid_label)
         
         # Valid label with different sentiment capitalization
         label_with_lowercase = {
@@ -71,6 +86,8 @@ class TestValidationService(unittest.TestCase):
         self.assertEqual(fixed_label["category"], "Product & Services")
         self.assertEqual(fixed_label["subcategory"], "Progress Pace")
         self.assertEqual(fixed_label["sentiment"], "Negative")
+        # The input label is not mutated
+        self.assertEqual(label_with_lowercase["sentiment"], "negative")
 
     def test_validate_and_fix_label_missing_fields(self):
         """Test validation of labels with missing fields."""
@@ -102,11 +119,7 @@ class TestValidationService(unittest.TestCase):
         fixed_label = self.service.validate_and_fix_label(no_subcategory)
         self.assertEqual(fixed_label["category"], "Product & Services")
         # Should assign a valid subcategory for Product & Services with Negative sentiment
-        self.assertIn(fixed_label["subcategory"], 
-                     ["Unsettled Debt", "Progress Pace", "Procedure", "Settlement Percentage",
-                      "Creditor Correspondence", "Debt Priority", "Settlement Failure",
-                      "Summons", "Legal Procedure", "Legal Plan Representation",
-                      "Lending", "Unmet Expectations (Services)", "Delayed Cancellation Requests"])
+        self.assertIn(fixed_label["subcategory"], _PS_NEGATIVE_SUBCATEGORIES)
         self.assertEqual(fixed_label["sentiment"], "Negative")
         
         # Almost empty label with just sentiment
@@ -135,11 +148,7 @@ class TestValidationService(unittest.TestCase):
         fixed_label = self.service.validate_and_fix_label(wrong_subcategory)
         self.assertEqual(fixed_label["category"], "Product & Services")
         self.assertNotEqual(fixed_label["subcategory"], "Fee Collection")
-        self.assertIn(fixed_label["subcategory"], 
-                     ["Unsettled Debt", "Progress Pace", "Procedure", "Settlement Percentage",
-                      "Creditor Correspondence", "Debt Priority", "Settlement Failure",
-                      "Summons", "Legal Procedure", "Legal Plan Representation",
-                      "Lending", "Unmet Expectations (Services)", "Delayed Cancellation Requests"])
+        self.assertIn(fixed_label["subcategory"], _PS_NEGATIVE_SUBCATEGORIES)
         
         # Invalid category
         invalid_category = {
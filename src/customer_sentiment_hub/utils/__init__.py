@@ -6,18 +6,18 @@ logging configuration, and helper functions used throughout the application.
 """
 
 from customer_sentiment_hub.utils.helpers import (
-    load_json_file, save_json_file, 
-    extract_review_texts, batch_items
+    load_json_file, save_json_file, ensure_dir, json_loads, json_dumps,
+    extract_review_texts, batch_items, batch_items_list
 )
 from customer_sentiment_hub.utils.logging import configure_logging
 from customer_sentiment_hub.utils.result import Result, Success, Error
 
 __all__ = [
     # File utilities
-    'load_json_file', 'save_json_file',
+    'load_json_file', 'save_json_file', 'ensure_dir', 'json_loads', 'json_dumps',
     
     # Data processing
-    'extract_review_texts', 'batch_items',
+    'extract_review_texts', 'batch_items', 'batch_items_list',
     
     # Application configuration
     'configure_logging',
@@ -7,14 +7,104 @@ and other common tasks used throughout the application.
 
 import json
 import logging
+import mmap
+import os
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, TypeVar, Union
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar, Union
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Files at least this large are memory-mapped rather than read when loading
+_MMAP_MIN_SIZE = 64 * 1024
+
+# orjson is a declared dependency (except on PyPy); fall back to stdlib json without it
+try:
+    import orjson
+
+    def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Parse a JSON document from UTF-8 bytes or a string.
+        
+        Args:
+            data: The JSON document
+            
+        Returns:
+            Any: The parsed value
+            
+        Raises:
+            json.JSONDecodeError: If data is not valid JSON
+        """
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        """
+        Serialize obj to UTF-8 encoded JSON.
+        
+        Args:
+            obj: The value to serialize
+            indent: Whether to indent by two spaces
+            sort_keys: Whether to sort object keys
+            
+        Returns:
+            bytes: The JSON document, with non-ASCII characters unescaped
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+
+    # orjson parses any buffer, so large files can be read from a memory map
+    _PARSES_BUFFERS = True
+except ImportError:
+    def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Parse a JSON document from UTF-8 bytes or a string."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON."""
+        return json.dumps(
+            obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False
+        ).encode('utf-8')
+
+    _PARSES_BUFFERS = False
+
+
+def _read_json(f: BinaryIO) -> Any:
+    """Parse an open JSON file, from a memory map when it is large."""
+    if not _PARSES_BUFFERS or os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+        return json_loads(f.read())
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return json_loads(view)
+
+
+# Directories ensure_dir has already created (or found) in this process
+_ENSURED_DIRS: Set[Path] = set()
+
+
+def ensure_dir(directory: Path) -> None:
+    """
+    Create a directory and its parents if needed.
+    
+    Directories created (or found) earlier in this process are remembered,
+    so repeated calls for the same directory skip the mkdir.
+    
+    Args:
+        directory: Path of the directory to create
+    """
+    if directory not in _ENSURED_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+
 def load_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Load and parse a JSON file with robust error handling.
@@ -30,24 +120,21 @@ def load_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
         json.JSONDecodeError: If the file contains invalid JSON
         PermissionError: If the file cannot be read due to permissions
     """
-    # Convert to Path object for better path handling
-    path = Path(file_path)
-    
     try:
         # Use with context manager for proper resource handling
-        with path.open('r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return _read_json(f)
     except FileNotFoundError:
-        logger.error(f"JSON file not found: {path}")
+        logger.error(f"JSON file not found: {file_path}")
         raise
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in file {path}: {str(e)}")
+        logger.error(f"Invalid JSON in file {file_path}: {str(e)}")
         raise
     except PermissionError:
-        logger.error(f"Permission denied when reading file: {path}")
+        logger.error(f"Permission denied when reading file: {file_path}")
         raise
     except Exception as e:
-        logger.error(f"Unexpected error reading JSON file {path}: {str(e)}")
+        logger.error(f"Unexpected error reading JSON file {file_path}: {str(e)}")
         raise
 
 
@@ -75,11 +162,22 @@ def save_json_file(
     
     try:
         # Create directory if it doesn't exist
-        path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(path.parent)
+        try:
+            f = path.open('wb')
+        except FileNotFoundError:
+            # The directory was removed after we created it; create it again
+            _ENSURED_DIRS.discard(path.parent)
+            ensure_dir(path.parent)
+            f = path.open('wb')
         
         # Use with context manager for proper resource handling
-        with path.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+        with f:
+            if indent in (None, 2) and not ensure_ascii:
+                f.write(json_dumps(data, indent=bool(indent)))
+            else:
+                # json_dumps only indents by two spaces and never escapes
+                f.write(json.dumps(data, indent=indent, ensure_ascii=ensure_ascii).encode('utf-8'))
             
         logger.debug(f"Successfully saved JSON data to {path}")
     except TypeError as e:
@@ -119,61 +217,106 @@ def extract_review_texts(data: Union[List, Dict]) -> List[str]:
         >>> extract_review_texts({"reviews": [{"text": "Review 1"}, {"text": "Review 2"}]})
         ["Review 1", "Review 2"]
     """
-    review_texts = []
+    review_texts: List[str] = []
+    append = review_texts.append
     
-    # Handle different input formats
+    # Handle different input formats. Items come from decoded JSON, so exact
+    # type checks (one pointer comparison each) are enough
     if isinstance(data, list):
         # Process list of strings or dictionaries
         for item in data:
-            if isinstance(item, str):
-                review_texts.append(item)
-            elif isinstance(item, dict) and 'text' in item:
-                review_texts.append(item['text'])
+            kind = type(item)
+            if kind is str:
+                append(item)
+            elif kind is dict:
+                text = item.get('text')
+                if text is not None:
+                    append(text)
                 
     elif isinstance(data, dict):
         # Check for reviews key first
-        if 'reviews' in data and isinstance(data['reviews'], list):
+        reviews = data.get('reviews')
+        if isinstance(reviews, list):
             # Extract from reviews list
-            for review in data['reviews']:
-                if isinstance(review, dict) and 'text' in review:
-                    review_texts.append(review['text'])
+            for review in reviews:
+                if type(review) is dict:
+                    text = review.get('text')
+                    if text is not None:
+                        append(text)
         else:
             # Extract string values from dictionary
-            for key, value in data.items():
-                if isinstance(value, str):
-                    review_texts.append(value)
+            for value in data.values():
+                if type(value) is str:
+                    append(value)
     
     return review_texts
 
 
-def batch_items(items: List[T], batch_size: int) -> List[List[T]]:
+def batch_items(items: Iterable[T], batch_size: int) -> Iterator[List[T]]:
     """
-    Split a list into batches of specified size.
+    Split items into batches of specified size, lazily.
     
-    This function is useful for processing large datasets in manageable chunks.
+    Batches are produced one at a time, so a caller that processes and
+    discards each batch never holds more than one in memory.
     
     Args:
-        items: The list to split
+        items: The items to split (any iterable)
         batch_size: Maximum size of each batch (must be > 0)
         
     Returns:
-        List[List[T]]: List of batches
+        Iterator[List[T]]: Iterator over the batches
         
     Raises:
         ValueError: If batch_size is less than or equal to zero
         
     Example:
-        >>> batch_items([1, 2, 3, 4, 5], 2)
+        >>> list(batch_items([1, 2, 3, 4, 5], 2))
         [[1, 2], [3, 4], [5]]
     """
+    # Checked here rather than in the generator so bad sizes fail immediately
     if batch_size <= 0:
         raise ValueError("Batch size must be greater than zero")
     
-    if not items:
-        return []
+    return _iter_batches(iter(items), batch_size)
+
+
+def _iter_batches(it: Iterator[T], batch_size: int) -> Iterator[List[T]]:
+    """Yield lists of up to batch_size items taken from it until it runs out."""
+    while batch := list(islice(it, batch_size)):
+        yield batch
+
+
+def batch_items_list(items: Iterable[T], batch_size: int) -> List[List[T]]:
+    """
+    Split items into a list of batches of specified size.
     
-    # Use list comprehension for efficiency
-    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    Eager form of batch_items for callers that need every batch at once.
+    
+    Args:
+        items: The items to split
+        batch_size: Maximum size of each batch (must be > 0)
+        
+    Returns:
+        List[List[T]]: List of batches
+        
+    Raises:
+        ValueError: If batch_size is less than or equal to zero
+        
+    Example:
+        >>> batch_items_list([1, 2, 3, 4, 5], 2)
+        [[1, 2], [3, 4], [5]]
+    """
+    return list(batch_items(items, batch_size))
+
+
+# Marks a key that safe_get did not find, since None may be a stored value
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation key path once; callers reuse the same few paths."""
+    return tuple(key_path.split('.'))
 
 
 def safe_get(data: Dict[str, Any], key_path: str, default: Any = None) -> Any:
@@ -194,13 +337,14 @@ def safe_get(data: Dict[str, Any], key_path: str, default: Any = None) -> Any:
         >>> safe_get({"user": {"profile": {}}}, "user.profile.name", "Unknown")
         "Unknown"
     """
-    keys = key_path.split('.')
+    keys = _split_key_path(key_path)
     result = data
     
     for key in keys:
-        if isinstance(result, dict) and key in result:
-            result = result[key]
-        else:
+        if not isinstance(result, dict):
+            return default
+        result = result.get(key, _MISSING)
+        if result is _MISSING:
             return default
             
     return result
\ No newline at end of file
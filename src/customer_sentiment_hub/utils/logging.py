@@ -5,13 +5,129 @@ This module provides functions and configuration for setting up
 consistent, flexible logging throughout the application.
 """
 
+import atexit
 import logging
 import logging.config
 import sys
 import os
+import time
 from datetime import datetime
+from functools import lru_cache
+from io import TextIOWrapper
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Optional, Union, List
+from queue import SimpleQueue
+from typing import Dict, List, Optional, Union, cast
+
+from customer_sentiment_hub.utils.helpers import ensure_dir
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that builds the date/time part of asctime once per second.
+
+    Output matches logging.Formatter; only the strftime call is reused for
+    records logged within the same second.
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt, datefmt)
+        self._last_second: Optional[int] = None
+        self._last_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time = time.strftime(
+                datefmt or self.default_time_format, self.converter(second)
+            )
+            self._last_second = second
+        if datefmt:
+            return self._last_time
+        if self.default_msec_format:
+            return self.default_msec_format % (self._last_time, record.msecs)
+        return self._last_time
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer instead of flushing
+    after every record.
+
+    Records reach the file in ``buffer_size`` chunks, when drain() is called,
+    or when the handler is closed.
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        mode: str = "a",
+        encoding: Optional[str] = None,
+        delay: bool = False,
+        buffer_size: int = 64 * 1024,
+    ) -> None:
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode, encoding, delay)
+
+    def _open(self) -> TextIOWrapper:
+        # FileHandler only opens text modes, so open() returns a TextIOWrapper
+        return cast(TextIOWrapper, open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors,
+        ))
+
+    def flush(self) -> None:
+        """Skip the per-record flush; see drain()."""
+
+    def drain(self) -> None:
+        """Write buffered records to the file."""
+        if self.lock is None:
+            return  # not set up yet, so nothing can be buffered
+        with self.lock:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener that drains buffered handlers whenever the queue runs dry."""
+
+    queue: "SimpleQueue[logging.LogRecord]"
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, BufferedFileHandler):
+                    handler.drain()
+        return self.queue.get(block)
+
+
+# Background thread that owns the real handlers; replaced on reconfiguration
+_listener: Optional[QueueListener] = None
+
+# Set once configure_logging has installed handlers
+_CONFIGURED = False
+
+# Level names accepted by configure_logging, e.g. "DEBUG" or "WARN"
+_LEVELS = logging.getLevelNamesMapping()
+
+# Third-party loggers held at WARNING unless we log at DEBUG
+_QUIET_LIBS = (
+    "google", "urllib3", "httpx", "fastapi",
+    "langchain", "botocore", "boto3", "asyncio",
+)
+
+
+def _stop_listener() -> None:
+    """Flush queued records, stop the listener thread and close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def configure_logging(
@@ -23,18 +139,37 @@ def configure_logging(
 ) -> None:
     """
     Configure logging for the application with flexible options.
+
+    Callers only put records on a queue; a listener thread formats them and
+    does the console and file I/O, writing the log file in batches whenever
+    the queue empties.
+
+    Calling it again with no arguments once logging is configured is a
+    no-op; any explicit option rebuilds the handlers.
     """
+    global _listener, _CONFIGURED
+
+    if (
+        _CONFIGURED
+        and log_level is None
+        and log_file is None
+        and log_format is None
+        and console_output
+        and file_output
+    ):
+        return
+
     # import settings here, not at module-level
     from customer_sentiment_hub.config.settings import settings
 
     # Determine log level
     level_name = log_level or settings.log_level
-    level = getattr(logging, level_name.upper())
+    unknown_level = level_name.upper() not in _LEVELS
+    level = _LEVELS.get(level_name.upper(), logging.INFO)
     
     # Determine log file path
     if log_file is None and file_output:
         logs_dir = Path("logs")
-        logs_dir.mkdir(exist_ok=True)
         app_name = settings.app_name.lower().replace(" ", "_")
         date_str = datetime.now().strftime("%Y-%m-%d")
         log_file = logs_dir / f"{app_name}_{date_str}.log"
@@ -43,23 +178,25 @@ def configure_logging(
     if log_format is None:
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    formatter = CachedTimeFormatter(log_format)
+    
     # Create handlers
     handlers: List[logging.Handler] = []
     
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_handler.setFormatter(logging.Formatter(log_format))
+        console_handler.setFormatter(formatter)
         handlers.append(console_handler)
     
     if file_output and log_file:
         # Create directory for log file if it doesn't exist
         log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(log_path.parent)
         
-        file_handler = logging.FileHandler(str(log_path))
+        file_handler = BufferedFileHandler(str(log_path))
         file_handler.setLevel(level)
-        file_handler.setFormatter(logging.Formatter(log_format))
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
     
     # Configure root logger
@@ -67,12 +204,19 @@ def configure_logging(
     root_logger.setLevel(level)
     
     # Remove existing handlers to avoid duplicates
+    _stop_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
-    # Add new handlers
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    # Route records through a queue to the new handlers
+    if handlers:
+        log_queue: SimpleQueue = SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _listener = _DrainingQueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
     
     # Configure specific loggers
     app_logger = logging.getLogger("customer_sentiment_hub")
@@ -80,16 +224,17 @@ def configure_logging(
     
     # Keep third-party loggers quieter
     if level > logging.DEBUG:
-        logging.getLogger("google").setLevel(logging.WARNING)
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
-        logging.getLogger("httpx").setLevel(logging.WARNING)
-        logging.getLogger("fastapi").setLevel(logging.WARNING)
+        for lib in _QUIET_LIBS:
+            logging.getLogger(lib).setLevel(logging.WARNING)
     
     # Log configuration details
-    app_logger.info(f"Logging configured at level {logging.getLevelName(level)}")
+    if unknown_level:
+        app_logger.warning("Unknown log level %r, using INFO", level_name)
+    app_logger.info("Logging configured at level %s", logging.getLevelName(level))
     for handler in handlers:
         if isinstance(handler, logging.FileHandler):
-            app_logger.info(f"Log file: {handler.baseFilename}")
+            app_logger.info("Log file: %s", handler.baseFilename)
+    _CONFIGURED = True
 
 
 def configure_logging_from_dict(config: Dict) -> None:
@@ -106,12 +251,18 @@ def configure_logging_from_dict(config: Dict) -> None:
     logging.info("Logging configured from dictionary configuration")
 
 
+_NAMESPACE = "customer_sentiment_hub"
+_NAMESPACE_PREFIX = _NAMESPACE + "."
+
+
+@lru_cache(maxsize=512)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the given name, creating it if it doesn't exist.
     
     This is a convenience function for getting loggers with the correct
-    naming convention for the application.
+    naming convention for the application. Loggers are cached by name, as
+    logging.getLogger returns the same instance for a name anyway.
     
     Args:
         name: The name of the logger (can be module name)
@@ -119,14 +270,12 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance
     """
-    # If name is a module, use its name
-    if "." in name and not name.startswith("customer_sentiment_hub"):
-        # Extract module name and prepend application namespace
-        module_name = name.split(".")[-1]
-        return logging.getLogger(f"customer_sentiment_hub.{module_name}")
+    # Names already in the application namespace, e.g. __name__ of our modules
+    if name.startswith(_NAMESPACE_PREFIX):
+        return logging.getLogger(name)
     
-    # Otherwise use the name directly
-    if not name.startswith("customer_sentiment_hub."):
-        name = f"customer_sentiment_hub.{name}"
+    # If name is another module, keep only its last component
+    if "." in name and not name.startswith(_NAMESPACE):
+        name = name.rsplit(".", 1)[-1]
     
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(f"{_NAMESPACE_PREFIX}{name}")
\ No newline at end of file
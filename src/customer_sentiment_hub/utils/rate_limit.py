@@ -0,0 +1,62 @@
+"""
+Rate limiting helpers for calls to quota-limited external APIs.
+
+This module provides a token bucket for asyncio code, so callers can pace
+their own requests instead of running into the provider's 429 responses
+and retrying.
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    The bucket holds up to ``capacity`` tokens and refills continuously at
+    ``capacity / period`` tokens per second. Waiters are served in arrival
+    order.
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0) -> None:
+        """
+        Initialize the bucket full.
+
+        Args:
+            capacity: Maximum tokens available per period
+            period: Length of the period in seconds
+
+        Raises:
+            ValueError: If capacity or period is not positive
+        """
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity and period must be positive")
+        self.capacity = float(capacity)
+        self._rate = self.capacity / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Wait until ``amount`` tokens are available and take them.
+
+        Requests larger than the capacity wait for a full bucket rather than
+        blocking forever.
+
+        Args:
+            amount: Number of tokens to take
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= amount
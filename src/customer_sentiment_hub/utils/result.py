@@ -7,6 +7,7 @@ handling compared to exceptions.
 """
 
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, Union, cast, overload
 
 T = TypeVar('T')  # Success value type
@@ -22,6 +23,8 @@ class Result(Generic[T]):
     to exceptions, making error handling visible in function signatures and
     encouraging proper error handling throughout the codebase.
     """
+
+    __slots__ = ()
     
     def is_success(self) -> bool:
         """
@@ -78,6 +81,22 @@ class Result(Generic[T]):
         """
         raise NotImplementedError("Subclasses must implement map")
     
+    def and_then(self, fn: Callable[[T], Union[Result[U], U]]) -> Result[U]:
+        """
+        Apply a function that may itself return a Result to the success value.
+        
+        Use map for plain T -> U functions and and_then for T -> Result[U],
+        which returns the function's Result as is instead of nesting it.
+        
+        Args:
+            fn: Function to apply to the success value
+            
+        Returns:
+            Result[U]: The function's result (wrapped in Success if it is not
+                      a Result), or the original error if the result is an error
+        """
+        raise NotImplementedError("Subclasses must implement and_then")
+    
     @staticmethod
     def success(value: T) -> Result[T]:
         """
@@ -87,8 +106,10 @@ class Result(Generic[T]):
             value: The success value
             
         Returns:
-            Result[T]: A success result
+            Result[T]: A success result (a shared instance when value is None)
         """
+        if value is None:
+            return _UNIT_SUCCESS
         return Success(value)
     
     @staticmethod
@@ -100,9 +121,10 @@ class Result(Generic[T]):
             error: The error message
             
         Returns:
-            Result[T]: An error result
+            Result[T]: An error result, shared with earlier calls that used
+                the same message
         """
-        return Error(error)
+        return _pooled_error(error)
     
     @staticmethod
     def from_exception(e: Exception, context: str = "") -> Result[T]:
@@ -120,7 +142,7 @@ class Result(Generic[T]):
             error_message = f"{context}: {str(e)}"
         else:
             error_message = str(e)
-        return Error(error_message)
+        return _pooled_error(error_message)
     
     @staticmethod
     def try_operation(operation: Callable[[], T], error_context: str = "") -> Result[T]:
@@ -145,8 +167,13 @@ class Success(Result[T]):
     """
     A successful result containing a value.
     
-    This represents an operation that completed successfully.
+    This represents an operation that completed successfully. Successes
+    are immutable, as the one returned by Result.success(None) is shared
+    between callers; the value itself may still be mutable.
     """
+
+    __slots__ = ("value",)
+    value: T
     
     def __init__(self, value: T):
         """
@@ -155,7 +182,19 @@ class Success(Result[T]):
         Args:
             value: The success value
         """
-        self.value = value
+        object.__setattr__(self, "value", value)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute assignment; successes are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion; successes are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __reduce__(self) -> Any:
+        """Rebuild through __init__ when copied or pickled."""
+        return (type(self), (self.value,))
     
     def is_success(self) -> bool:
         """
@@ -199,6 +238,19 @@ class Success(Result[T]):
         """
         return Success(fn(self.value))
     
+    def and_then(self, fn: Callable[[T], Union[Result[U], U]]) -> Result[U]:
+        """
+        Apply a function that may return a Result to the success value.
+        
+        Args:
+            fn: Function to apply to the success value
+            
+        Returns:
+            Result[U]: The function's Result, or its value wrapped in Success
+        """
+        out = fn(self.value)
+        return out if isinstance(out, Result) else Success(out)
+    
     def __str__(self) -> str:
         """String representation of the success result."""
         return f"Success: {self.value}"
@@ -212,8 +264,14 @@ class Error(Result[T]):
     """
     An error result containing an error message.
     
-    This represents an operation that failed.
+    This represents an operation that failed. Errors are immutable, as
+    instances returned by Result.error and Result.from_exception are
+    shared between callers.
     """
+
+    __slots__ = ("error",)
+    # The instance attribute shadows the Result.error factory on instances
+    error: str  # type: ignore[assignment]
     
     def __init__(self, error: str):
         """
@@ -222,7 +280,19 @@ class Error(Result[T]):
         Args:
             error: The error message
         """
-        self.error = error
+        object.__setattr__(self, "error", error)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute assignment; errors are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion; errors are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __reduce__(self) -> Any:
+        """Rebuild through __init__ when copied or pickled."""
+        return (type(self), (self.error,))
     
     def is_success(self) -> bool:
         """
@@ -266,6 +336,18 @@ class Error(Result[T]):
         """
         return Error(self.error)
     
+    def and_then(self, fn: Callable[[T], Union[Result[U], U]]) -> Result[U]:
+        """
+        Apply a function to the success value (no-op for Error).
+        
+        Args:
+            fn: Function to apply (unused for Error)
+            
+        Returns:
+            Result[U]: This error result
+        """
+        return cast(Error[U], self)
+    
     def __str__(self) -> str:
         """String representation of the error result."""
         return f"Error: {self.error}"
@@ -275,6 +357,16 @@ class Error(Result[T]):
         return f"Error({repr(self.error)})"
 
 
+# Shared result for operations that succeed without a value
+_UNIT_SUCCESS: Success[Any] = Success(None)
+
+
+@lru_cache(maxsize=256)
+def _pooled_error(message: str) -> Error[Any]:
+    """Return the shared Error for a message, keeping the most recently used."""
+    return Error(message)
+
+
 def collect_results(results: List[Result[T]]) -> Result[List[T]]:
     """
     Collect multiple results into a single result.
@@ -288,11 +380,9 @@ def collect_results(results: List[Result[T]]) -> Result[List[T]]:
     Returns:
         Result[List[T]]: Success with list of values or the first error
     """
-    values = []
-    
-    for result in results:
-        if result.is_error():
-            return cast(Error[List[T]], result)
-        values.append(result.unwrap())
+    failed = next((result for result in results if not result.is_success()), None)
+    if failed is not None:
+        return cast(Error[List[T]], failed)
     
-    return Success(values)
\ No newline at end of file
+    # Every result is a Success here, so unwrap() cannot raise
+    return Success([result.unwrap() for result in results])
\ No newline at end of file
@@ -2,27 +2,132 @@
 
 import os
 import json
+import hashlib
+import logging
+import stat
 import tempfile
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, cast
+
 import boto3
 from botocore.exceptions import ClientError
 
-def fetch_gemini_secret(secret_name: str, region_name: str) -> dict:
-    """
-    Retrieve the JSON payload stored in AWS Secrets Manager under `secret_name`.
+logger = logging.getLogger(__name__)
+
+# Secrets Manager clients by region; building one loads boto3's config and models
+_SM_CLIENT_CACHE: Dict[str, Any] = {}
+
+# Credential files already written, by (secret_name, region_name)
+_CREDENTIALS_PATHS: Dict[Tuple[str, str], str] = {}
+
+
+def _sm_client(region_name: str) -> Any:
+    """Return the Secrets Manager client for a region, creating it once."""
+    client = _SM_CLIENT_CACHE.get(region_name)
+    if client is None:
+        session = boto3.session.Session()
+        client = session.client(service_name="secretsmanager", region_name=region_name)
+        _SM_CLIENT_CACHE[region_name] = client
+    return client
+
+
+@lru_cache(maxsize=16)
+def _fetch_secret_string(secret_name: str, region_name: str) -> str:
     """
-    session = boto3.session.Session()
-    client = session.client(service_name="secretsmanager", region_name=region_name)
+    Fetch a SecretString once per (secret_name, region_name).
 
+    The value is kept for the life of the process, so a secret rotated in
+    Secrets Manager is not picked up until a restart (or cache_clear()).
+    """
     try:
-        resp = client.get_secret_value(SecretId=secret_name)
+        resp = _sm_client(region_name).get_secret_value(SecretId=secret_name)
     except ClientError as e:
         raise
 
     secret_str = resp.get("SecretString")
-    if not secret_str:
+    if not isinstance(secret_str, str) or not secret_str:
         raise ValueError(f"Secret {secret_name} did not contain a SecretString")
+    return secret_str
 
-    return json.loads(secret_str)
+
+def fetch_gemini_secret(secret_name: str, region_name: str) -> dict:
+    """
+    Retrieve the JSON payload stored in AWS Secrets Manager under `secret_name`.
+
+    The secret is fetched once per process and never refreshed, so a
+    rotated secret needs a restart; each call returns a fresh dict.
+    """
+    return cast(dict, json.loads(_fetch_secret_string(secret_name, region_name)))
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """True if st belongs to this user and no one else can read or write it."""
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def _credentials_dir() -> str:
+    """
+    Return this user's private directory for credential files.
+
+    The directory has a stable name in the temp directory, so files
+    survive restarts, and is created with 0o700 permissions. If something
+    else already holds that name (another user's directory, a symlink or
+    a directory others can open), a fresh private directory is used instead.
+    """
+    path = os.path.join(tempfile.gettempdir(), f"customer_sentiment_hub-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+        return path
+    except FileExistsError:
+        pass
+
+    st = os.lstat(path)
+    if stat.S_ISDIR(st.st_mode) and _is_private(st):
+        return path
+    logger.warning(f"Not using {path} for credentials: it is not a private directory")
+    return tempfile.mkdtemp(prefix="customer_sentiment_hub-")
+
+
+def _read_private_file(path: str) -> Optional[bytes]:
+    """Return the contents of path if it is a regular file only this user can access."""
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+    except OSError:
+        return None
+    with os.fdopen(fd, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not (stat.S_ISREG(st.st_mode) and _is_private(st)):
+            return None
+        return f.read()
+
+
+def _write_credentials_file(secret_name: str, region_name: str, creds: dict) -> str:
+    """
+    Write credentials to a per-secret file in this user's private directory.
+
+    The file name is stable across restarts, so an existing file with the
+    same contents is reused, provided this user owns it and no one else can
+    access it. Otherwise the file is written with 0o600 permissions to a
+    temp name and moved into place.
+    """
+    key = hashlib.sha256(f"{region_name}/{secret_name}".encode()).hexdigest()[:16]
+    directory = _credentials_dir()
+    path = os.path.join(directory, f"gemini_creds_{key}.json")
+    data = json.dumps(creds).encode()
+
+    if _read_private_file(path) == data:
+        return path
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.lexists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path
 
 
 def load_gemini_credentials(
@@ -30,24 +135,31 @@ def load_gemini_credentials(
     region_name: str = "us-west-1"
 ) -> str:
     """
-    Fetches the service‑account JSON from AWS, writes it to a temp file,
+    Fetches the service‑account JSON from AWS, writes it to a file in a
+    private temp directory (skipped when an earlier run left an identical one),
     and sets the following environment variables:
 
       - GOOGLE_APPLICATION_CREDENTIALS
       - GOOGLE_CLOUD_PROJECT
       - GOOGLE_CLOUD_LOCATION
 
+    Repeated calls for the same secret return the file written by the
+    first call while it still exists.
+
     Returns:
         Path to the temp JSON file.
     """
+    cached_path = _CREDENTIALS_PATHS.get((secret_name, region_name))
+    if cached_path is not None and os.path.exists(cached_path):
+        return cached_path
+
     creds = fetch_gemini_secret(secret_name, region_name)
 
-    if "private_key" in creds and isinstance(creds["private_key"], str):
-        creds["private_key"] = creds["private_key"].replace("\\n", "\n")
-    # Write to a secure temp file
-    fd, path = tempfile.mkstemp(prefix="gemini_creds_", suffix=".json")
-    with os.fdopen(fd, "w") as f:
-        json.dump(creds, f)
+    # Unescape newlines only when the secret stored the key with literal \n
+    private_key = creds.get("private_key")
+    if isinstance(private_key, str) and "\\n" in private_key:
+        creds["private_key"] = private_key.replace("\\n", "\n")
+    path = _write_credentials_file(secret_name, region_name, creds)
 
     # Export for Google libraries
     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = path
@@ -56,4 +168,5 @@ def load_gemini_credentials(
     if creds.get("location"):
         os.environ["GOOGLE_CLOUD_LOCATION"] = creds["location"]
 
+    _CREDENTIALS_PATHS[(secret_name, region_name)] = path
     return path